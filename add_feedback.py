@@ -4,9 +4,12 @@ Implements Federated Learning and Meta-Learning updates
 """
 
 import sys
-from enhanced_engine import EnhancedRecommendationEngine
+import sqlite3
+import threading
 from datetime import datetime
 
+DB_PATH = "data/ideas.db"
+
 def display_banner():
     print("\n" + "="*80)
     print("  GIG - USER FEEDBACK SYSTEM")
@@ -60,20 +63,38 @@ def get_comparison_preference(idea1, idea2):
             return choice
         print("❌ Please enter A, B, or Equal")
 
+def _preload_engine(holder):
+    """Import the engine module chain (runs in a background thread)"""
+    try:
+        from enhanced_engine import EnhancedRecommendationEngine
+        holder["engine_cls"] = EnhancedRecommendationEngine
+    except Exception as e:
+        holder["error"] = e
+
+def _count_stored_ideas(db_path):
+    """Count stored ideas without loading the engine (0 if the database doesn't exist yet)"""
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM ideas").fetchone()[0]
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return 0
+
 def main():
     display_banner()
     
-    # Initialize engine
-    print("🚀 Loading recommendation engine...")
-    engine = EnhancedRecommendationEngine()
-    print(f"✅ Loaded {len(engine.db.get_all_ideas())} ideas\n")
-    
-    ideas = engine.db.get_all_ideas()
-    
-    if not ideas:
+    if not _count_stored_ideas(DB_PATH):
         print("❌ No ideas found in database. Add some ideas first!")
         return
     
+    # Import the engine in the background so it overlaps with the user's menu choice
+    print("🚀 Loading recommendation engine...")
+    holder = {}
+    loader = threading.Thread(target=_preload_engine, args=(holder,), daemon=True)
+    loader.start()
+    
     print("Choose feedback mode:")
     print("1. Rate individual ideas (for Elo updates)")
     print("2. Compare ideas pairwise (for preference learning)")
@@ -82,6 +103,24 @@ def main():
     
     choice = input("\nYour choice (1-4): ").strip()
     
+    if choice not in ("1", "2", "3"):
+        print("\n👋 Exiting feedback system")
+        return
+    
+    loader.join()
+    if "error" in holder:
+        print(f"❌ Failed to load engine: {holder['error']}")
+        return
+    # Only built once a mode is chosen, so exiting skips the database and index load
+    engine = holder["engine_cls"](db_path=DB_PATH)
+    
+    ideas = engine.db.get_all_ideas()
+    print(f"✅ Loaded {len(ideas)} ideas\n")
+    
+    if not ideas:
+        print("❌ No ideas found in database. Add some ideas first!")
+        return
+    
     if choice == "1":
         # Individual rating mode
         display_ideas(ideas)
@@ -265,10 +304,6 @@ def main():
         # Update engine weights
         print("\n💡 You can now use these optimized weights in future recommendations!")
     
-    else:
-        print("\n👋 Exiting feedback system")
-        return
-    
     # Show updated statistics
     print("\n" + "="*80)
     print("  LEARNING STATISTICS")
@@ -0,0 +1,18 @@
+"""CLI Utilities - Output helpers shared by the command-line entry points"""
+
+import contextlib
+import io
+import sys
+
+
+@contextlib.contextmanager
+def buffered_output():
+    """Collect a section's prints and write them to stdout in a single call"""
+    target = sys.stdout
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        target.write(buffer.getvalue())
+        target.flush()
@@ -32,6 +32,7 @@ from .blockchain import IntegrityBlockchainLayer
 from .ethics_filter import InteractiveEthicsFilter
 from .twin_generator import IdeaTwinGenerator
 from .evaluation import EvaluationDashboard
+from .semantic_cache import SemanticIdeaCache
 
 __all__ = [
     # Original modules
@@ -63,5 +64,6 @@ __all__ = [
     'IntegrityBlockchainLayer',
     'InteractiveEthicsFilter',
     'IdeaTwinGenerator',
-    'EvaluationDashboard'
+    'EvaluationDashboard',
+    'SemanticIdeaCache'
 ]
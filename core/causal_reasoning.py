@@ -157,3 +157,31 @@ class CausalReasoningModule:
         # Normalize and clamp
         normalized = score / (1.0 + score)  # Sigmoid-like normalization
         return max(0.0, min(1.0, normalized))
+    
+    def compute_causal_impact_scores(self, feature_matrix: np.ndarray,
+                                     feature_names: List[str]) -> np.ndarray:
+        """
+        Vectorized compute_causal_impact_score for a batch of ideas.
+        
+        Args:
+            feature_matrix: Array of shape (n_ideas, n_features)
+            feature_names: Column names of feature_matrix
+            
+        Returns:
+            Causal impact scores [0, 1], one per row
+            
+        Security: Ignores non-finite values and clamps output
+        """
+        features = np.asarray(feature_matrix, dtype=np.float64)
+        if features.size == 0:
+            return np.zeros(len(features))
+        
+        # Per-feature causal strength; insignificant effects contribute nothing
+        weights = np.array([self.estimate_causal_effect(name, "outcome") for name in feature_names])
+        weights[weights <= 0.1] = 0.0
+        
+        scores = np.where(np.isfinite(features), features, 0.0) @ weights
+        
+        # Normalize and clamp
+        normalized = scores / (1.0 + scores)
+        return np.clip(normalized, 0.0, 1.0)
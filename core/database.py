@@ -6,10 +6,13 @@ SQLite-based storage with integrity hashing and FAISS vector search
 import sqlite3
 import json
 import hashlib
+import os
+import threading
 import numpy as np
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 # FAISS import with fallback
 try:
@@ -19,10 +22,34 @@ except ImportError:
     FAISS_AVAILABLE = False
     print("⚠️  FAISS not available, using simple cosine similarity")
 
+# SimSIMD import with fallback (SIMD cosine kernels for the simple search path)
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+# orjson import with fallback (C JSON codec for tags/SWOT columns and ID sidecars)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes (orjson when available)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to compact JSON text (orjson when available)"""
+    return orjson.dumps(obj).decode() if ORJSON_AVAILABLE else json.dumps(obj)
 
-@dataclass
+
+@dataclass(slots=True)
 class Idea:
-    """Core idea data structure"""
+    """Core idea data structure (slotted: no per-instance __dict__)"""
     idea_id: str
     title: str
     description: str
@@ -38,6 +65,7 @@ class Idea:
     uncertainty: float = 0.5
     hash_signature: str = ""
     author: str = "AI-Generated"
+    _lower_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -46,6 +74,13 @@ class Idea:
             self.tags = []
         if self.swot is None:
             self.swot = {"strengths": [], "weaknesses": [], "opportunities": [], "threats": []}
+    
+    @property
+    def lower_text(self) -> str:
+        """Canonical lowercased "title description" text (computed once per idea)"""
+        if self._lower_text is None:
+            self._lower_text = f"{self.title} {self.description or ''}".lower()
+        return self._lower_text
 
 
 class IdeaDatabase:
@@ -53,8 +88,22 @@ class IdeaDatabase:
     SQLite database with integrity hashing and FAISS vector similarity search.
     Ensures data integrity and tamper-evident storage.
     Automatically uses FAISS for large datasets (>100 ideas), simple search for small ones.
+    Switches from exact (flat) to approximate HNSW search for very large datasets,
+    and to IVF-PQ (compressed codes) for huge ones.
     """
     
+    FAISS_THRESHOLD = 100       # Minimum ideas before FAISS is used
+    HNSW_THRESHOLD = 1000       # Minimum ideas before HNSW replaces the flat index
+    IVFPQ_THRESHOLD = 100000    # Minimum ideas before IVF-PQ replaces HNSW
+    HNSW_M = 32                 # HNSW graph neighbours per node
+    HNSW_EF_CONSTRUCTION = 200  # HNSW build-time search depth
+    HNSW_EF_SEARCH = 64         # HNSW query-time search depth
+    IVFPQ_NPROBE = 16           # Minimum IVF lists visited per query (grows as sqrt(nlist))
+    
+    # FAISS class persisted for each index tier; files of another type
+    # (e.g. written by an older version) are rebuilt on load
+    INDEX_TYPES = {"flat": "IndexFlatIP", "hnsw": "IndexHNSWSQ", "ivfpq": "IndexIVFPQ"}
+    
     def __init__(self, db_path: str = "data/ideas.db", use_faiss: bool = True):
         """
         Initialize database connection and schema.
@@ -64,16 +113,37 @@ class IdeaDatabase:
             use_faiss: Whether to use FAISS (auto-fallback if unavailable)
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # Connection may be used from worker threads (callers serialize writes)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL lets commits append to a log instead of syncing the main file each time
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+        self._batch_depth = 0  # >0 while inside batch(): defer commits
         self.use_faiss = use_faiss and FAISS_AVAILABLE
         self.faiss_index = None
         self.faiss_id_map = []  # Maps FAISS index to idea_id
         self.embedding_dim = None
+        self._index_mmapped = False  # Loaded read-only from disk
+        self._index_dirty = False    # Changed since last persisted
+        self._matrix = None          # (capacity, d) float32 normalized embeddings
+        self._matrix_ids = []        # Row -> idea_id for the filled part of _matrix
+        self._matrix_dirty = False   # Rows appended since the matrix was persisted
+        self._matrix_lock = threading.Lock()  # Guards the lazy matrix load
+        self._search = self._search_simple    # Default backend, chosen when the index changes
+        self._faiss_ready = False
         self._init_schema()
         
-        # Build FAISS index if enabled
-        if self.use_faiss:
+        # Load persisted FAISS index, or build it if missing/stale
+        if self.use_faiss and not self._load_faiss_index():
             self._build_faiss_index()
+        
+        # Small datasets are searched via the embedding matrix: load it now
+        # so the first query doesn't pay for the cold build
+        if self.faiss_index is None:
+            self._load_embedding_matrix()
+        self._select_search_backend()
     
     def _init_schema(self):
         """Create database schema if not exists"""
@@ -101,6 +171,8 @@ class IdeaDatabase:
         # Create index for faster lookups
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON ideas(timestamp)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_hash ON ideas(hash_signature)")
+        # Duplicate checks look ideas up by exact title (B-tree search, not a table scan)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_title ON ideas(title)")
         
         self.conn.commit()
     
@@ -157,20 +229,26 @@ class IdeaDatabase:
                 idea.trend_score,
                 idea.provenance_score,
                 idea.timestamp.isoformat(),
-                json.dumps(idea.tags),
-                json.dumps(idea.swot),
+                _json_dumps(idea.tags),
+                _json_dumps(idea.swot),
                 idea.elo_rating,
                 idea.bayesian_mean,
                 idea.uncertainty,
                 idea.hash_signature,
                 idea.author
             ))
-            self.conn.commit()
+            if not self._batch_depth:
+                self.conn.commit()
+            
+            # Keep in-memory embedding matrix in sync once loaded
+            if self._matrix is not None:
+                self._append_to_matrix(idea)
             
-            # Rebuild FAISS index if using FAISS and dataset is large enough
+            # Keep FAISS index in sync: append incrementally, build once threshold is reached
             if self.use_faiss:
-                ideas_count = len(self.get_all_ideas())
-                if ideas_count >= 100:
+                if self.faiss_index is not None:
+                    self._add_to_faiss_index(idea)
+                elif self.count_ideas() >= self.FAISS_THRESHOLD:
                     self.rebuild_faiss_index()
             
             return idea.idea_id
@@ -178,6 +256,22 @@ class IdeaDatabase:
             print(f"Error adding idea: {e}")
             return None
     
+    @contextmanager
+    def batch(self):
+        """
+        Group several add_idea calls into one transaction (single commit on exit).
+        
+        Yields:
+            This database
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.conn.commit()
+    
     def update_idea(self, idea: Idea) -> bool:
         """
         Update existing idea and regenerate hash.
@@ -216,8 +310,8 @@ class IdeaDatabase:
             trend_score=row[5],
             provenance_score=row[6],
             timestamp=datetime.fromisoformat(row[7]),
-            tags=json.loads(row[8]),
-            swot=json.loads(row[9]),
+            tags=_json_loads(row[8]),
+            swot=_json_loads(row[9]),
             elo_rating=row[10],
             bayesian_mean=row[11],
             uncertainty=row[12],
@@ -225,6 +319,40 @@ class IdeaDatabase:
             author=row[14] if len(row) > 14 else "AI-Generated"
         )
     
+    def count_ideas(self) -> int:
+        """
+        Count ideas without loading them.
+        
+        Returns:
+            Number of stored ideas
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM ideas")
+        return cursor.fetchone()[0]
+    
+    def existing_titles(self, titles: List[str]) -> set:
+        """
+        Find which titles are already stored (same rule as add_idea's duplicate check).
+        
+        Args:
+            titles: Candidate idea titles
+            
+        Returns:
+            Set of titles that already exist
+        """
+        titles = list(set(titles))
+        found = set()
+        cursor = self.conn.cursor()
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(titles), 500):
+            chunk = titles[start:start + 500]
+            cursor.execute(
+                f"SELECT title FROM ideas WHERE title IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            found.update(row[0] for row in cursor.fetchall())
+        return found
+    
     def get_all_ideas(self) -> List[Idea]:
         """
         Retrieve all ideas from database.
@@ -266,48 +394,244 @@ class IdeaDatabase:
     def _build_faiss_index(self):
         """
         Build or rebuild FAISS index from all ideas in database.
-        Uses IndexFlatIP (inner product) for normalized vectors.
+        Uses IndexFlatIP (exact inner product) for normalized vectors,
+        IndexHNSWSQ (approximate, logarithmic search over 8-bit scalar-quantized
+        vectors) for >=1000 ideas and
+        IndexIVFPQ (product-quantized codes) for >=100k ideas.
         Auto-switches to simple search if <100 ideas.
         """
-        ideas = self.get_all_ideas()
+        n = self.count_ideas()
         
-        if not ideas:
+        if not n:
             return
         
         # Use FAISS only for large datasets
-        if len(ideas) < 100:
-            print(f"📊 Dataset size: {len(ideas)} ideas - using simple similarity (FAISS threshold: 100)")
+        if n < self.FAISS_THRESHOLD:
+            print(f"📊 Dataset size: {n} ideas - using simple similarity (FAISS threshold: {self.FAISS_THRESHOLD})")
             self.faiss_index = None
             return
         
-        # Get embedding dimension from first idea
-        self.embedding_dim = len(ideas[0].embedding)
-        
-        # Create FAISS index (IndexFlatIP for inner product/cosine similarity)
-        self.faiss_index = faiss.IndexFlatIP(self.embedding_dim)
-        
-        # Prepare embeddings matrix
-        embeddings = np.array([idea.embedding for idea in ideas], dtype=np.float32)
+        # Only the embedding column is read (no Idea objects are decoded)
+        ids, embeddings = self._stored_embeddings()
+        self.embedding_dim = embeddings.shape[1]
         
         # Normalize vectors for cosine similarity
         faiss.normalize_L2(embeddings)
         
+        # Create FAISS index (inner product == cosine similarity on normalized vectors)
+        self.faiss_index = self._create_faiss_index(len(ids))
+        if not self.faiss_index.is_trained:
+            self.faiss_index.train(embeddings)
+        
         # Add to index
         self.faiss_index.add(embeddings)
         
         # Update ID mapping
-        self.faiss_id_map = [idea.idea_id for idea in ideas]
+        self.faiss_id_map = ids
+        self._index_mmapped = False
+        
+        print(f"✅ FAISS index built: {len(ids)} ideas, dimension {self.embedding_dim}")
+        self._save_faiss_index()
+    
+    def _index_paths(self) -> Optional[Tuple[str, str]]:
+        """Sidecar paths for the persisted index and its ID map (None for in-memory DBs)"""
+        if self.db_path == ":memory:":
+            return None
+        return self.db_path + ".faiss", self.db_path + ".idmap"
+    
+    def _embeddings_hash(self) -> str:
+        """
+        Content hash of all stored (idea_id, embedding) pairs.
+        
+        Returns:
+            Hex digest (independent of row order)
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT idea_id, embedding FROM ideas ORDER BY idea_id")
+        for idea_id, embedding in cursor:
+            digest.update(idea_id.encode())
+            digest.update(embedding or b"")
+        return digest.hexdigest()
+    
+    def faiss_index_is_current(self) -> bool:
+        """
+        Check whether the persisted index was built from the current embeddings.
+        
+        Returns:
+            True if index, ID map and matching embeddings hash are on disk
+        """
+        paths = self._index_paths()
+        if paths is None or not all(os.path.exists(p) for p in paths):
+            return False
+        try:
+            with open(paths[0] + ".hash") as f:
+                return f.read().strip() == self._embeddings_hash()
+        except OSError:
+            return False
+    
+    def _save_faiss_index(self):
+        """Persist FAISS index, ID mapping and embeddings hash next to the database file"""
+        paths = self._index_paths()
+        if paths is None or self.faiss_index is None:
+            return
+        index_path, idmap_path = paths
+        try:
+            # Write to temporary files, then swap in atomically
+            faiss.write_index(self.faiss_index, index_path + ".tmp")
+            with open(idmap_path + ".tmp", "w") as f:
+                f.write(_json_dumps(self.faiss_id_map))
+            with open(index_path + ".hash.tmp", "w") as f:
+                f.write(self._embeddings_hash())
+            os.replace(index_path + ".tmp", index_path)
+            os.replace(idmap_path + ".tmp", idmap_path)
+            os.replace(index_path + ".hash.tmp", index_path + ".hash")
+            self._index_dirty = False
+        except (OSError, RuntimeError) as e:
+            print(f"⚠️  Could not persist FAISS index: {e}")
+    
+    def _load_faiss_index(self) -> bool:
+        """
+        Memory-map a persisted FAISS index if it matches the stored ideas.
+        
+        Returns:
+            True if the index was loaded, False if it must be rebuilt
+        """
+        paths = self._index_paths()
+        if paths is None or not all(os.path.exists(p) for p in paths):
+            return False
+        index_path, idmap_path = paths
+        
+        try:
+            with open(idmap_path, "rb") as f:
+                id_map = _json_loads(f.read())
+            
+            # Ideas are append-only, so every indexed ID still present means matching vectors
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT idea_id FROM ideas ORDER BY rowid")
+            current_ids = [row[0] for row in cursor.fetchall()]
+            indexed = set(id_map)
+            missing = [i for i in current_ids if i not in indexed]
+            if len(current_ids) - len(missing) != len(id_map):
+                return False
+            if self._index_kind(len(current_ids)) != self._index_kind(len(id_map)):
+                return False
+            
+            if missing:
+                index = faiss.read_index(index_path)
+            else:
+                index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except (OSError, ValueError, RuntimeError):
+            return False
+        
+        if index.ntotal != len(id_map):
+            return False
+        if type(index).__name__ != self.INDEX_TYPES[self._index_kind(len(id_map))]:
+            return False
+        
+        self.faiss_index = index
+        self.faiss_id_map = id_map
+        self.embedding_dim = index.d
+        self._index_mmapped = not missing
+        
+        # Catch up with ideas added since the index was last persisted
+        if missing:
+            vectors = np.array([self.get_idea_by_id(i).embedding for i in missing], dtype=np.float32)
+            faiss.normalize_L2(vectors)
+            self.faiss_index.add(vectors)
+            self.faiss_id_map.extend(missing)
+            self._save_faiss_index()
+        return True
+    
+    def _index_kind(self, n: int) -> str:
+        """Index type appropriate for a dataset of n ideas"""
+        if n >= self.IVFPQ_THRESHOLD:
+            return "ivfpq"
+        if n >= self.HNSW_THRESHOLD:
+            return "hnsw"
+        return "flat"
+    
+    def _create_faiss_index(self, n: int):
+        """
+        Create an empty FAISS index sized for n ideas.
         
-        print(f"✅ FAISS index built: {len(ideas)} ideas, dimension {self.embedding_dim}")
+        Args:
+            n: Number of ideas to index
+            
+        Returns:
+            FAISS index (IVF-PQ and SQ8 HNSW indexes still need training)
+        """
+        d = self.embedding_dim
+        kind = self._index_kind(n)
+        
+        if kind == "ivfpq":
+            nlist = int(4 * np.sqrt(n))
+            # Sub-quantizers must divide the dimension; aim for 4 dims per code byte
+            m = max(k for k in range(1, max(1, d // 4) + 1) if d % k == 0)
+            quantizer = faiss.IndexFlatIP(d)
+            index = faiss.IndexIVFPQ(quantizer, d, nlist, m, 8, faiss.METRIC_INNER_PRODUCT)
+            # Probe ~sqrt(nlist) lists so recall holds as the list count grows with n
+            index.nprobe = max(self.IVFPQ_NPROBE, int(np.sqrt(nlist)))
+            return index
+        
+        if kind == "hnsw":
+            # 8-bit scalar quantization stores 1 byte per dimension instead of 4
+            # (graph walks move a quarter of the bytes, ~1-2% recall@10 cost)
+            index = faiss.IndexHNSWSQ(d, faiss.ScalarQuantizer.QT_8bit, self.HNSW_M,
+                                      faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = self.HNSW_EF_SEARCH
+            return index
+        
+        return faiss.IndexFlatIP(d)
     
-    def rebuild_faiss_index(self):
+    def _add_to_faiss_index(self, idea: Idea):
+        """
+        Append a single idea to the existing FAISS index (no full rebuild).
+        
+        Args:
+            idea: Newly stored idea
+        """
+        # Memory-mapped indexes are read-only; load a private copy before mutating
+        if self._index_mmapped:
+            self.faiss_index = faiss.read_index(self._index_paths()[0])
+            self._index_mmapped = False
+        
+        vector = idea.embedding.astype(np.float32).reshape(1, -1)
+        faiss.normalize_L2(vector)
+        self.faiss_index.add(vector)
+        self.faiss_id_map.append(idea.idea_id)
+        self._index_dirty = True
+        
+        # Upgrade index type once the dataset crosses a size threshold
+        if self._index_kind(len(self.faiss_id_map)) != self._index_kind(len(self.faiss_id_map) - 1):
+            self.rebuild_faiss_index()
+    
+    def rebuild_faiss_index(self, force: bool = True) -> bool:
         """
         Rebuild FAISS index (call after adding/removing ideas).
+        
+        Args:
+            force: Rebuild even if the persisted index matches the stored embeddings
+            
+        Returns:
+            True if the index was rebuilt
         """
-        if self.use_faiss:
-            self._build_faiss_index()
+        if not self.use_faiss:
+            return False
+        if not force and self.faiss_index is not None and self.faiss_index_is_current():
+            return False
+        self._build_faiss_index()
+        self._select_search_backend()
+        return True
     
-    def search_similar(self, query_embedding: np.ndarray, top_k: int = 10) -> List[Tuple[str, float]]:
+    def _select_search_backend(self):
+        """Pick the default search backend once, whenever the FAISS index is (re)built"""
+        self._faiss_ready = self.use_faiss and self.faiss_index is not None and self.faiss_index.ntotal > 0
+        self._search = self._search_with_faiss if self._faiss_ready else self._search_simple
+    
+    def search_similar(self, query_embedding: np.ndarray, top_k: int = 10,
+                       backend: Optional[str] = None) -> List[Tuple[str, float]]:
         """
         Find similar ideas using FAISS or cosine similarity.
         Automatically uses FAISS for large datasets (>100 ideas).
@@ -315,20 +639,18 @@ class IdeaDatabase:
         Args:
             query_embedding: Query embedding vector
             top_k: Number of results to return
+            backend: Force 'faiss' or 'simple' search (None = automatic)
             
         Returns:
             List of (idea_id, similarity_score) tuples
         """
-        ideas = self.get_all_ideas()
-        
-        if not ideas:
-            return []
-        
-        # Use FAISS if index exists and dataset is large enough
-        if self.use_faiss and self.faiss_index is not None and len(ideas) >= 100:
-            return self._search_with_faiss(query_embedding, top_k)
-        else:
-            return self._search_simple(query_embedding, top_k, ideas)
+        if backend is None:
+            return self._search(query_embedding, top_k)
+        if backend == "faiss":
+            return self._search_with_faiss(query_embedding, top_k) if self._faiss_ready else []
+        if backend == "simple":
+            return self._search_simple(query_embedding, top_k)
+        raise ValueError(f"Unknown search backend: {backend}")
     
     def _search_with_faiss(self, query_embedding: np.ndarray, top_k: int) -> List[Tuple[str, float]]:
         """
@@ -351,35 +673,203 @@ class IdeaDatabase:
         # Map indices to idea_ids
         results = []
         for i, (idx, sim) in enumerate(zip(indices[0], similarities[0])):
-            if idx < len(self.faiss_id_map):
+            if 0 <= idx < len(self.faiss_id_map):
                 idea_id = self.faiss_id_map[idx]
                 results.append((idea_id, float(sim)))
         
         return results
     
-    def _search_simple(self, query_embedding: np.ndarray, top_k: int, ideas: List) -> List[Tuple[str, float]]:
+    def _matrix_paths(self) -> Optional[Tuple[str, str]]:
+        """Sidecar paths for the persisted embedding matrix and its row IDs (None for in-memory DBs)"""
+        if self.db_path == ":memory:":
+            return None
+        return self.db_path + ".matrix.npy", self.db_path + ".matrix.ids"
+    
+    def _save_embedding_matrix(self):
+        """Persist the normalized embedding matrix and its row IDs next to the database file"""
+        paths = self._matrix_paths()
+        if paths is None or not self._matrix_ids:
+            return
+        matrix_path, ids_path = paths
+        try:
+            # Write to temporary files, then swap in atomically
+            with open(matrix_path + ".tmp", "wb") as f:
+                np.save(f, np.ascontiguousarray(self._matrix[:len(self._matrix_ids)]))
+            with open(ids_path + ".tmp", "w") as f:
+                f.write(_json_dumps(self._matrix_ids))
+            os.replace(matrix_path + ".tmp", matrix_path)
+            os.replace(ids_path + ".tmp", ids_path)
+            self._matrix_dirty = False
+        except OSError as e:
+            print(f"⚠️  Could not persist embedding matrix: {e}")
+    
+    def _load_persisted_matrix(self) -> bool:
+        """
+        Memory-map a persisted embedding matrix if it matches the stored ideas.
+        
+        Returns:
+            True if the matrix was loaded, False if it must be rebuilt
+        """
+        paths = self._matrix_paths()
+        if paths is None or not all(os.path.exists(p) for p in paths):
+            return False
+        matrix_path, ids_path = paths
+        
+        try:
+            with open(ids_path, "rb") as f:
+                ids = _json_loads(f.read())
+            
+            # Rows follow insertion order and ideas are append-only, so a valid
+            # matrix covers a prefix of the current IDs
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT idea_id FROM ideas ORDER BY rowid")
+            current_ids = [row[0] for row in cursor.fetchall()]
+            if not ids or current_ids[:len(ids)] != ids:
+                return False
+            
+            matrix = np.load(matrix_path, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError):
+            return False
+        
+        if matrix.ndim != 2 or len(matrix) != len(ids) or matrix.dtype != np.float32:
+            return False
+        
+        # The mapping has no spare rows, so the first append copies it into memory
+        # (IDs first: searches test the matrix to skip the lazy load)
+        self._matrix_ids = ids
+        self._matrix = matrix
+        
+        # Catch up with ideas added since the matrix was last persisted
+        missing = current_ids[len(ids):]
+        if missing:
+            for idea_id in missing:
+                self._append_to_matrix(self.get_idea_by_id(idea_id))
+            self._save_embedding_matrix()
+        return True
+    
+    def _load_embedding_matrix(self):
+        """
+        Load all embeddings into one contiguous float32 (N, d) matrix,
+        L2-normalized once so each query is a single mat-vec.
+        Reuses the persisted matrix when it is current; otherwise builds it
+        from the database and persists it.
+        """
+        if self._load_persisted_matrix():
+            return
+        
+        ids, matrix = self._stored_embeddings()
+        if ids:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+        
+        # Publish the matrix last: searches test it to skip the lazy load
+        self._matrix_ids, self._matrix = ids, matrix
+        if ids:
+            self._save_embedding_matrix()
+    
+    def _stored_embeddings(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Read every stored embedding straight from the embedding column.
+        
+        Returns:
+            Tuple of (idea IDs in insertion order, (N, d) float32 matrix)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT idea_id, embedding FROM ideas ORDER BY rowid")
+        rows = cursor.fetchall()
+        if not rows:
+            return [], np.empty((0, 0), dtype=np.float32)
+        
+        # Embeddings are stored as float64 bytes: decode all rows in one buffer
+        blob = b"".join(row[1] for row in rows)
+        embeddings = np.frombuffer(blob, dtype=np.float64).reshape(len(rows), -1)
+        return [row[0] for row in rows], embeddings.astype(np.float32)
+    
+    def _append_to_matrix(self, idea: Idea):
+        """
+        Append one normalized embedding to the in-memory matrix.
+        
+        Args:
+            idea: Newly stored idea
+        """
+        vector = np.asarray(idea.embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        
+        n = len(self._matrix_ids)
+        if n == 0:
+            self._matrix = np.empty((64, len(vector)), dtype=np.float32)
+        elif n >= len(self._matrix):
+            # Grow capacity geometrically to keep appends amortized O(d)
+            # (also moves a memory-mapped matrix into writable memory)
+            grown = np.empty((2 * n, self._matrix.shape[1]), dtype=np.float32)
+            grown[:n] = self._matrix[:n]
+            self._matrix = grown
+        
+        self._matrix[n] = vector
+        self._matrix_ids.append(idea.idea_id)
+        self._matrix_dirty = True
+    
+    def _search_simple(self, query_embedding: np.ndarray, top_k: int) -> List[Tuple[str, float]]:
         """
         Simple cosine similarity search (for small datasets).
         
         Args:
             query_embedding: Query vector
             top_k: Number of results
-            ideas: List of ideas
             
         Returns:
             List of (idea_id, similarity_score) tuples
         """
-        similarities = []
+        if self._matrix is None:
+            # Only cold when FAISS serves queries and 'simple' is forced
+            with self._matrix_lock:
+                if self._matrix is None:
+                    self._load_embedding_matrix()
+        
+        n = len(self._matrix_ids)
+        if not n:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
         
-        for idea in ideas:
-            # Cosine similarity via dot product (embeddings are normalized)
-            sim = float(np.dot(query_embedding, idea.embedding))
-            similarities.append((idea.idea_id, sim))
+        scores = self._cosine_scores(query, self._matrix[:n])
         
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        # Partial selection of the top_k, then sort only those
+        k = min(top_k, n)
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._matrix_ids[i], float(scores[i])) for i in top]
+    
+    @staticmethod
+    def _cosine_scores(query_embedding: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of one query against every row of a matrix.
+        Uses SimSIMD's SIMD kernels when installed, otherwise one BLAS mat-vec
+        (embeddings are normalized, so the dot product is the cosine).
+        
+        Args:
+            query_embedding: Query vector (d,)
+            matrix: Embedding matrix (N, d)
+            
+        Returns:
+            Similarity scores (N,)
+        """
+        if SIMSIMD_AVAILABLE:
+            distances = np.asarray(simsimd.cdist(query_embedding[None, :], matrix, metric="cosine"))
+            return 1.0 - distances.reshape(-1)
+        return matrix @ query_embedding
     
     def close(self):
-        """Close database connection"""
+        """Persist pending FAISS index and matrix changes and close database connection"""
+        if self._index_dirty:
+            self._save_faiss_index()
+        if self._matrix_dirty:
+            self._save_embedding_matrix()
         self.conn.close()
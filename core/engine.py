@@ -26,6 +26,10 @@ from core.mmr import MMRDiversityRanker
 class RecommendationEngine:
     """Complete end-to-end recommendation system"""
     
+    # Score components, in column order of the per-candidate component matrix
+    COMPONENT_KEYS = ("elo", "bayesian_mean", "uncertainty", "sentiment", "provenance",
+                      "freshness", "trend", "causal_impact", "serendipity")
+    
     def __init__(self, db_path: str = "data/ideas.db", ollama_model: str = "llama2"):
         """
         Initialize all modules
@@ -58,7 +62,8 @@ class RecommendationEngine:
         self.mmr = MMRDiversityRanker()
     
     def add_idea(self, title: str, description: str, author: str = "system",
-                tags: Optional[List[str]] = None) -> str:
+                tags: Optional[List[str]] = None,
+                precomputed_embedding: Optional[np.ndarray] = None) -> str:
         """
         Add new idea to system
         
@@ -67,12 +72,37 @@ class RecommendationEngine:
             description: Idea description
             author: Author name
             tags: Optional tags list
+            precomputed_embedding: Embedding of description (skips generation)
             
         Returns:
             Idea ID
         """
+        return self._store_idea(self._build_idea(title, description, tags, precomputed_embedding))
+    
+    def _build_idea(self, title: str, description: str,
+                    tags: Optional[List[str]] = None,
+                    precomputed_embedding: Optional[np.ndarray] = None) -> Idea:
+        """
+        Build a scored Idea object (embedding, SWOT, sentiment, trend) without storing it.
+        
+        Args:
+            title: Idea title
+            description: Idea description
+            tags: Optional tags list
+            precomputed_embedding: Embedding of description (skips generation)
+            
+        Returns:
+            Idea object with an empty idea_id
+        """
+        # Reject spam on text alone before paying for embedding and analysis
+        if not self.fairness.filter_adversarial_text(description):
+            raise ValueError("Idea flagged as adversarial/spam")
+        
         # Generate embedding
-        embedding = self.ollama.generate_embedding(description)
+        if precomputed_embedding is not None:
+            embedding = precomputed_embedding
+        else:
+            embedding = self.ollama.generate_embedding(description)
         
         # Generate SWOT tags
         if tags is None:
@@ -104,26 +134,39 @@ class RecommendationEngine:
             provenance_score=0.7
         )
         
-        # Verify it's not adversarial
-        if not self.fairness.filter_adversarial(idea):
+        # Verify the scores aren't adversarial (text was checked above)
+        if not self.fairness.filter_adversarial_scores(idea):
             raise ValueError("Idea flagged as adversarial/spam")
         
+        return idea
+    
+    def _store_idea(self, idea: Idea) -> str:
+        """
+        Store a built idea and track its first version.
+        
+        Args:
+            idea: Idea from _build_idea (idea_id and hash are filled in place)
+            
+        Returns:
+            Idea ID (None if duplicate)
+        """
         # Add to database
         idea_id = self.db.add_idea(idea)
         
         # Track version
         self.evolution.track_version(idea_id, {
-            "title": title,
-            "description": description,
-            "sentiment": sentiment,
-            "trend": trend_score
+            "title": idea.title,
+            "description": idea.description,
+            "sentiment": idea.sentiment,
+            "trend": idea.trend_score
         })
         
         return idea_id
     
     def get_recommendations(self, query: str, top_k: int = 10,
                           view: str = "consensus",
-                          use_mmr: bool = True) -> List[Dict[str, Any]]:
+                          use_mmr: bool = True,
+                          include_idea: bool = False) -> List[Dict[str, Any]]:
         """
         Get personalized recommendations
         
@@ -132,6 +175,8 @@ class RecommendationEngine:
             top_k: Number of results
             view: Ranking perspective (user/market/swot/consensus)
             use_mmr: Apply MMR diversity
+            include_idea: Attach the loaded Idea object under "_idea"
+                (lets callers skip re-fetching it from the database)
             
         Returns:
             List of recommended ideas with scores and explanations
@@ -150,71 +195,94 @@ class RecommendationEngine:
         
         # Search similar ideas
         similar_ideas = self.db.search_similar(query_emb, top_k=top_k * 2)
-        ideas_subset = [self.db.get_idea_by_id(idea_id) for idea_id, sim_score in similar_ideas]
-        ideas_subset = [i for i in ideas_subset if i is not None]
+        # Candidates come from the ideas already loaded above (no re-fetch per hit)
+        ideas_by_id = {idea.idea_id: idea for idea in ideas}
+        ideas_subset = [ideas_by_id[idea_id] for idea_id, sim_score in similar_ideas
+                        if idea_id in ideas_by_id]
+        
+        # Candidate embeddings stacked once into one contiguous matrix, shared
+        # by the graph and MMR (which gathers rows in its own order)
+        embeddings = np.array([idea.embedding for idea in ideas_subset], dtype=float)
         
         # Build relationship graph
-        self.graph.build_graph(ideas_subset)
+        self.graph.build_graph(ideas_subset, embeddings)
         influence_scores = self.graph.calculate_influence()
         
-        # Compute scores for each idea
-        scored_ideas = []
-        for idea in ideas_subset:
-            # Time freshness
-            freshness = self.time_decay.calculate_freshness(idea.timestamp)
-            
-            # Graph influence
-            influence = influence_scores.get(idea.idea_id, 0.0)
-            
-            # ESG score
-            esg = self.esg.compute_esg_score(idea)
-            
-            # Compute components
-            components = {
-                "elo": idea.elo_rating / 1500.0,  # Normalize
-                "bayesian_mean": idea.bayesian_mean,
-                "uncertainty": idea.uncertainty,
-                "sentiment": idea.sentiment,
-                "provenance": idea.provenance_score,
-                "freshness": freshness,
-                "trend": idea.trend_score,
-                "causal_impact": influence,
-                "serendipity": 1.0 - similar_ideas[0][1] if similar_ideas else 0.5  # Inverse of similarity
-            }
-            
-            # Get weights
+        # Per-idea score components as one (n, components) matrix, built in
+        # a single pass over the candidates (freshness is batched)
+        n = len(ideas_subset)
+        freshness = self.time_decay.calculate_freshness_batch([idea.timestamp for idea in ideas_subset])
+        serendipity = 1.0 - similar_ideas[0][1] if similar_ideas else 0.5  # Inverse of similarity
+        C = np.array([
+            (idea.elo_rating / 1500.0,  # Normalize
+             idea.bayesian_mean,
+             idea.uncertainty,
+             idea.sentiment,
+             idea.provenance_score,
+             fresh,
+             idea.trend_score,
+             influence_scores.get(idea.idea_id, 0.0),  # Graph influence
+             serendipity)
+            for idea, fresh in zip(ideas_subset, freshness)
+        ], dtype=float).reshape(n, len(self.COMPONENT_KEYS))
+        
+        # Weights only depend on data quality, so they are adapted once per
+        # distinct provenance value and gathered into rows
+        qualities, quality_rows = np.unique(C[:, self.COMPONENT_KEYS.index("provenance")],
+                                            return_inverse=True)
+        quality_weights = []
+        for quality in qualities:
             weights = self.weights.adapt_weights({
                 "domain": "general",
                 "market_volatility": 0.5,
-                "data_quality": idea.provenance_score,
+                "data_quality": float(quality),
                 "fairness_adjustment": False
             })
             
             # Rebalance if bias detected
             if bias_report["bias_detected"]:
                 weights = self.fairness.rebalance_weights(weights, bias_report)
-            
-            # Calculate final score
-            final_score = sum(components[k] * weights[k] for k in components.keys())
+            quality_weights.append(weights)
+        weight_rows = [quality_weights[j] for j in quality_rows]
+        
+        # ESG and integrity scores
+        esg_results = [self.esg.compute_esg_score(idea) for idea in ideas_subset]
+        integrity_scores = self.integrity.compute_integrity_scores(ideas_subset)
+        
+        # Fuse all scores in one vectorized pass
+        final_scores = np.zeros(n)
+        if n:
+            W = np.array([[w[k] for k in self.COMPONENT_KEYS] for w in quality_weights],
+                         dtype=float)[quality_rows]
+            final_scores = np.einsum("ij,ij->i", C, W)
             
             # Integrate ESG
-            final_score = self.esg.aggregate_with_esg(final_score, esg["total_esg"])
+            esg_totals = np.array([esg["total_esg"] for esg in esg_results], dtype=float)
+            final_scores = self.esg.aggregate_with_esg(final_scores, esg_totals)
             
             # Integrity score boost
-            integrity_score = self.integrity.compute_integrity_score(idea.idea_id)
-            final_score *= (1 + integrity_score * 0.1)
-            
-            scored_ideas.append({
-                "idea": idea,
-                "final_score": final_score,
-                "components": components,
-                "weights": weights,
-                "esg": esg,
-                "integrity": integrity_score
-            })
-        
-        # Sort by score
-        scored_ideas.sort(key=lambda x: x["final_score"], reverse=True)
+            final_scores *= 1 + integrity_scores * 0.1
+        
+        # Order by score (stable, like list.sort). When only the top_k are
+        # kept as-is, partition to the k-th best score first and sort only the
+        # rows at or above it (index order keeps ties resolved like the full sort)
+        if view == "consensus" and not use_mmr and 0 < top_k < len(final_scores):
+            kth_score = -np.partition(-final_scores, top_k - 1)[top_k - 1]
+            order = np.flatnonzero(final_scores >= kth_score)
+            order = order[np.argsort(-final_scores[order], kind="stable")][:top_k]
+        else:
+            order = np.argsort(-final_scores, kind="stable")
+        scored_ideas = [
+            {
+                "idea": ideas_subset[i],
+                "final_score": float(final_scores[i]),
+                "components": dict(zip(self.COMPONENT_KEYS, C[i].tolist())),
+                "weights": weight_rows[i],
+                "esg": esg_results[i],
+                "integrity": float(integrity_scores[i])
+            }
+            for i in order
+        ]
         
         # Apply view-based ranking if requested
         if view != "consensus":
@@ -225,10 +293,13 @@ class RecommendationEngine:
         
         # Apply MMR diversity
         if use_mmr:
+            row_of = {idea.idea_id: i for i, idea in enumerate(ideas_subset)}
+            rows = [row_of[s["idea"].idea_id] for s in scored_ideas]
             mmr_results = self.mmr.mmr_rank(
                 [s["idea"] for s in scored_ideas],
                 query_emb,
-                top_k=top_k
+                top_k=top_k,
+                embeddings=np.take(embeddings, rows, axis=0)
             )
             # Reorder
             id_to_scored = {s["idea"].idea_id: s for s in scored_ideas}
@@ -261,7 +332,7 @@ class RecommendationEngine:
                 item["final_score"]
             )
             
-            results.append({
+            result = {
                 "rank": rank,
                 "idea_id": idea.idea_id,
                 "title": idea.title,
@@ -277,7 +348,10 @@ class RecommendationEngine:
                     "top_features": top_features,
                     "breakdown": breakdown
                 }
-            })
+            }
+            if include_idea:
+                result["_idea"] = idea
+            results.append(result)
         
         return results
     
@@ -1,6 +1,7 @@
 """Sustainability and ESG Scoring Module"""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import functools
 
 
 class SustainabilityAndESGScorer:
@@ -26,6 +27,10 @@ class SustainabilityAndESGScorer:
                 "control", "monitoring", "report", "ethical", "responsible"
             ]
         }
+        
+        # Scores depend only on the idea text, so each text is scanned once
+        # (ideas are re-scored on every request they are a candidate for)
+        self._text_scores = functools.lru_cache(maxsize=4096)(self._score_text)
     
     def compute_esg_score(self, idea) -> Dict[str, float]:
         """
@@ -37,8 +42,25 @@ class SustainabilityAndESGScorer:
         Returns:
             Dictionary with E, S, G scores and total
         """
-        text = (idea.title + " " + idea.description).lower()
+        e_normalized, s_normalized, g_normalized, total_score = self._text_scores(idea.lower_text)
         
+        return {
+            "environmental": e_normalized,
+            "social": s_normalized,
+            "governance": g_normalized,
+            "total_esg": total_score
+        }
+    
+    def _score_text(self, text: str) -> Tuple[float, float, float, float]:
+        """
+        Keyword-based E, S, G scores for lowercased idea text.
+        
+        Args:
+            text: Lowercased title and description
+            
+        Returns:
+            Tuple of (environmental, social, governance, total) scores
+        """
         e_score = sum(1 for kw in self.esg_keywords["environmental"] if kw in text)
         s_score = sum(1 for kw in self.esg_keywords["social"] if kw in text)
         g_score = sum(1 for kw in self.esg_keywords["governance"] if kw in text)
@@ -49,13 +71,7 @@ class SustainabilityAndESGScorer:
         g_normalized = min(1.0, g_score / 3.0)
         
         total_score = (e_normalized + s_normalized + g_normalized) / 3.0
-        
-        return {
-            "environmental": e_normalized,
-            "social": s_normalized,
-            "governance": g_normalized,
-            "total_esg": total_score
-        }
+        return e_normalized, s_normalized, g_normalized, total_score
     
     def rank_by_esg(self, ideas: List, dimension: str = "total_esg") -> List[Dict[str, Any]]:
         """
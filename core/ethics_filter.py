@@ -1,8 +1,11 @@
 """Interactive Ethics Filter - Pre-ranking ethical/regulatory screening"""
 
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Set, FrozenSet, Tuple
 import re
 
+# Word tokens: a single-word keyword matches r'\bkeyword\b' exactly when it is one of these
+_WORD_RE = re.compile(r"\w+")
+
 
 class InteractiveEthicsFilter:
     """
@@ -31,6 +34,24 @@ class InteractiveEthicsFilter:
             "transparent", "privacy", "consent", "gdpr", "hipaa"
         }
         
+        # Positive ethical indicators (expanded)
+        self.ethical_indicators = {
+            "sustainable": 0.12, "ethical": 0.12, "fair": 0.08, "inclusive": 0.08,
+            "accessible": 0.08, "transparent": 0.08, "responsible": 0.08,
+            "community": 0.08, "environmental": 0.08, "social": 0.08,
+            "benefit": 0.06, "improve": 0.06, "help": 0.06, "safe": 0.06,
+            "quality": 0.05, "education": 0.05, "health": 0.05, "welfare": 0.05,
+            "affordable": 0.05, "secure": 0.05, "privacy": 0.05, "people": 0.04
+        }
+        
+        # Multi-word domains still need a bounded regex; single words are
+        # looked up in the text's word set
+        self._high_risk_phrases = {
+            domain: re.compile(r'\b' + re.escape(domain) + r'\b')
+            for domain in self.high_risk_domains
+            if not _WORD_RE.fullmatch(domain)
+        }
+        
         self.filter_history = []
     
     def flagged(self, idea_text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -46,8 +67,8 @@ class InteractiveEthicsFilter:
             
         Security: Sanitizes input, safe regex matching
         """
-        # Input sanitization
-        safe_text = str(idea_text)[:5000].lower()
+        # Input sanitization (text is lowercased and tokenized once for all checks)
+        safe_text, words = self._normalize(idea_text)
         
         flags = []
         severity = "none"
@@ -55,7 +76,7 @@ class InteractiveEthicsFilter:
         compliance_score = 0.0
         
         # Check for prohibited content
-        prohibited_found = self._check_prohibited(safe_text)
+        prohibited_found = self._check_prohibited(words)
         if prohibited_found:
             flags.append({
                 "type": "prohibited_content",
@@ -67,10 +88,10 @@ class InteractiveEthicsFilter:
             should_flag = True
         
         # Check high-risk domains
-        high_risk_found = self._check_high_risk(safe_text, metadata)
+        high_risk_found = self._check_high_risk(safe_text, words, metadata)
         if high_risk_found:
             # Check if proper compliance indicators present
-            compliance_found = self._check_compliance(safe_text)
+            compliance_found = self._check_compliance(words)
             
             if not compliance_found:
                 flags.append({
@@ -89,14 +110,14 @@ class InteractiveEthicsFilter:
                 compliance_score = min(1.0, len(compliance_found) / 5.0)
         else:
             # Not high-risk domain, give moderate compliance score
-            compliance_found = self._check_compliance(safe_text)
+            compliance_found = self._check_compliance(words)
             if compliance_found:
                 compliance_score = min(1.0, len(compliance_found) / 3.0)
             else:
                 compliance_score = 0.4  # Base compliance for normal ideas
         
         # Check for ethical indicators (positive signals)
-        ethical_score = self._calculate_ethical_score(safe_text, metadata)
+        ethical_score = self._calculate_ethical_score(words, metadata)
         
         # Privacy and data protection checks
         privacy_concerns = self._check_privacy_concerns(safe_text)
@@ -129,21 +150,31 @@ class InteractiveEthicsFilter:
             "adjustment_factor": self._get_adjustment_factor(severity, ethical_score)
         }
     
-    def _check_prohibited(self, text: str) -> Set[str]:
+    def _normalize(self, idea_text: str) -> Tuple[str, FrozenSet[str]]:
+        """
+        Sanitize idea text once for all checks.
+        
+        Args:
+            idea_text: Combined title and description
+            
+        Returns:
+            Tuple of (truncated lowercase text, set of its word tokens)
+        """
+        safe_text = str(idea_text)[:5000].lower()
+        return safe_text, frozenset(_WORD_RE.findall(safe_text))
+    
+    def _check_prohibited(self, words: FrozenSet[str]) -> Set[str]:
         """Check for prohibited keywords"""
-        found = set()
-        for keyword in self.prohibited_keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text):
-                found.add(keyword)
-        return found
+        return self.prohibited_keywords & words
     
-    def _check_high_risk(self, text: str, metadata: Dict[str, Any] = None) -> Set[str]:
+    def _check_high_risk(self, text: str, words: FrozenSet[str],
+                         metadata: Dict[str, Any] = None) -> Set[str]:
         """Check for high-risk domains"""
-        found = set()
+        found = self.high_risk_domains & words
         
-        # Check in text
-        for domain in self.high_risk_domains:
-            if re.search(r'\b' + re.escape(domain) + r'\b', text):
+        # Check multi-word domains in text
+        for domain, pattern in self._high_risk_phrases.items():
+            if pattern.search(text):
                 found.add(domain)
         
         # Check in metadata tags
@@ -157,13 +188,9 @@ class InteractiveEthicsFilter:
         
         return found
     
-    def _check_compliance(self, text: str) -> Set[str]:
+    def _check_compliance(self, words: FrozenSet[str]) -> Set[str]:
         """Check for compliance keywords"""
-        found = set()
-        for keyword in self.compliance_keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text):
-                found.add(keyword)
-        return found
+        return self.compliance_keywords & words
     
     def _check_privacy_concerns(self, text: str) -> List[str]:
         """Check for privacy-related concerns"""
@@ -181,22 +208,13 @@ class InteractiveEthicsFilter:
         
         return concerns
     
-    def _calculate_ethical_score(self, text: str, metadata: Dict[str, Any] = None) -> float:
+    def _calculate_ethical_score(self, words: FrozenSet[str], metadata: Dict[str, Any] = None) -> float:
         """Calculate ethical alignment score"""
         score = 0.0
         
-        # Positive ethical indicators (expanded)
-        ethical_indicators = {
-            "sustainable": 0.12, "ethical": 0.12, "fair": 0.08, "inclusive": 0.08,
-            "accessible": 0.08, "transparent": 0.08, "responsible": 0.08,
-            "community": 0.08, "environmental": 0.08, "social": 0.08,
-            "benefit": 0.06, "improve": 0.06, "help": 0.06, "safe": 0.06,
-            "quality": 0.05, "education": 0.05, "health": 0.05, "welfare": 0.05,
-            "affordable": 0.05, "secure": 0.05, "privacy": 0.05, "people": 0.04
-        }
-        
-        for indicator, weight in ethical_indicators.items():
-            if re.search(r'\b' + re.escape(indicator) + r'\b', text):
+        # Summed in table order (keeps the float result stable)
+        for indicator, weight in self.ethical_indicators.items():
+            if indicator in words:
                 score += weight
         
         # ESG-related terms
@@ -66,22 +66,48 @@ class FairnessAndRobustnessModule:
         Args:
             idea: Idea object
             
+        Returns:
+            True if legitimate, False if adversarial
+        """
+        return self.filter_adversarial_text(idea.description) and self.filter_adversarial_scores(idea)
+    
+    def filter_adversarial_scores(self, idea) -> bool:
+        """
+        Score-only manipulation checks (for ideas whose text already passed
+        filter_adversarial_text)
+        
+        Args:
+            idea: Idea object
+            
+        Returns:
+            True if legitimate, False if adversarial
+        """
+        # Check for unrealistic scores
+        if idea.sentiment > 0.95 and idea.trend_score > 0.95:
+            return False
+        
+        return True
+    
+    def filter_adversarial_text(self, description: str) -> bool:
+        """
+        Text-only spam checks (no scores needed, so they can run before
+        embedding and analysis)
+        
+        Args:
+            description: Idea description
+            
         Returns:
             True if legitimate, False if adversarial
         """
         # Check for keyword stuffing
-        words = idea.description.lower().split()
+        words = description.lower().split()
         if len(words) > 10:
             unique_ratio = len(set(words)) / len(words)
             if unique_ratio < 0.3:
                 return False
         
-        # Check for unrealistic scores
-        if idea.sentiment > 0.95 and idea.trend_score > 0.95:
-            return False
-        
         # Check for empty content
-        if len(idea.description.strip()) < 20:
+        if len(description.strip()) < 20:
             return False
         
         return True
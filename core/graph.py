@@ -1,7 +1,7 @@
 """Idea Relationship Graph Module"""
 
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 from collections import defaultdict
 
 
@@ -19,28 +19,44 @@ class IdeaRelationshipGraph:
         self.graph = {}  # Adjacency list: idea_id -> [(neighbor_id, weight), ...]
         self.influence_scores = {}
     
-    def build_graph(self, ideas: List):
+    def build_graph(self, ideas: List, embeddings: Optional[np.ndarray] = None):
         """
         Build graph based on embedding similarity and shared tags
         
         Args:
             ideas: List of Idea objects
+            embeddings: Optional (n, d) matrix of the ideas' embeddings, row-aligned
+                with ideas (avoids stacking them again when the caller has it)
         """
         self.graph = {idea.idea_id: [] for idea in ideas}
+        if len(ideas) < 2:
+            return
         
-        for i, idea1 in enumerate(ideas):
-            for idea2 in ideas[i+1:]:
-                # Cosine similarity from embeddings
-                sim = float(np.dot(idea1.embedding, idea2.embedding))
-                
-                # Boost for shared tags
-                shared_tags = set(idea1.tags) & set(idea2.tags)
-                sim += 0.1 * len(shared_tags)
-                
-                # Create bidirectional edge if above threshold
-                if sim >= self.similarity_threshold:
-                    self.graph[idea1.idea_id].append((idea2.idea_id, sim))
-                    self.graph[idea2.idea_id].append((idea1.idea_id, sim))
+        # Cosine similarity from embeddings (all pairs in one matrix product)
+        if embeddings is None:
+            embeddings = np.array([idea.embedding for idea in ideas], dtype=float)
+        sim = embeddings @ embeddings.T
+        
+        # Boost for shared tags: each idea's tag set is built once, and pair
+        # counts come from a one-hot idea x tag matrix
+        tag_columns = {}
+        rows, cols = [], []
+        for i, idea in enumerate(ideas):
+            for tag in set(idea.tags):
+                rows.append(i)
+                cols.append(tag_columns.setdefault(tag, len(tag_columns)))
+        if tag_columns:
+            one_hot = np.zeros((len(ideas), len(tag_columns)))
+            one_hot[rows, cols] = 1.0
+            sim += 0.1 * (one_hot @ one_hot.T)
+        
+        # Create bidirectional edges above threshold (upper triangle, in the
+        # same pair order as a nested i < j loop)
+        pairs_i, pairs_j = np.nonzero(np.triu(sim >= self.similarity_threshold, k=1))
+        ids = [idea.idea_id for idea in ideas]
+        for i, j, weight in zip(pairs_i.tolist(), pairs_j.tolist(), sim[pairs_i, pairs_j].tolist()):
+            self.graph[ids[i]].append((ids[j], weight))
+            self.graph[ids[j]].append((ids[i], weight))
     
     def calculate_influence(self) -> Dict[str, float]:
         """
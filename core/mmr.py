@@ -1,9 +1,55 @@
 """MMR Diversity Ranking Module"""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 
 
+def _mmr_select(embeddings: np.ndarray, relevance: np.ndarray,
+                lambda_param: float, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Greedy MMR selection over unit-normalized embeddings.
+    
+    Args:
+        embeddings: Unit-normalized idea embeddings (n, d)
+        relevance: Cosine relevance of each idea to the query (n,)
+        lambda_param: Balance between relevance and diversity
+        top_k: Number of items to select (at least one is always selected)
+        
+    Returns:
+        Tuple of (selected indices, score each item was selected with)
+    """
+    relevance_term = lambda_param * relevance
+    selected = []
+    scores = []
+    available = np.ones(len(relevance), dtype=bool)
+    
+    # Select first item (highest relevance)
+    first_idx = int(np.argmax(relevance))
+    selected.append(first_idx)
+    scores.append(float(relevance_term[first_idx]))
+    available[first_idx] = False
+    
+    # Diversity component (max similarity to selected), updated incrementally.
+    # Only the similarity rows of selected items are ever needed, so each
+    # step does one mat-vec instead of building the full pairwise matrix
+    max_sim = embeddings @ embeddings[first_idx]
+    
+    # Iteratively select diverse items
+    while len(selected) < top_k and available.any():
+        # MMR formula
+        mmr_scores = relevance_term - (1 - lambda_param) * max_sim
+        mmr_scores[~available] = -np.inf
+        
+        # Select best MMR
+        best_idx = int(np.argmax(mmr_scores))
+        selected.append(best_idx)
+        scores.append(float(mmr_scores[best_idx]))
+        available[best_idx] = False
+        np.maximum(max_sim, embeddings @ embeddings[best_idx], out=max_sim)
+    
+    return np.array(selected, dtype=np.int64), np.array(scores)
+
+
 class MMRDiversityRanker:
     """Maximal Marginal Relevance for diverse rankings"""
     
@@ -22,8 +68,15 @@ class MMRDiversityRanker:
             return 0.0
         return np.dot(vec1, vec2) / (norm1 * norm2)
     
+    @staticmethod
+    def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize rows (zero rows stay zero, giving 0 cosine like cosine_similarity)"""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
     def mmr_rank(self, ideas: List, query_embedding: np.ndarray,
-                 top_k: int = 10) -> List[Dict[str, Any]]:
+                 top_k: int = 10, embeddings: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """
         MMR ranking: balance relevance to query with diversity
         
@@ -31,6 +84,8 @@ class MMRDiversityRanker:
             ideas: List of Idea objects (with embeddings)
             query_embedding: Query vector
             top_k: Number of diverse results
+            embeddings: Optional (n, d) matrix of the ideas' embeddings, row-aligned
+                with ideas (avoids stacking them again when the caller has it)
             
         Returns:
             Ranked list with MMR scores
@@ -38,53 +93,27 @@ class MMRDiversityRanker:
         if not ideas:
             return []
         
-        # Compute relevance scores
-        relevance = []
-        for idea in ideas:
-            sim = self.cosine_similarity(idea.embedding, query_embedding)
-            relevance.append(sim)
-        
-        # MMR selection
-        selected = []
-        remaining = list(range(len(ideas)))
+        # Normalize every embedding once; all cosines then come from dot products
+        if embeddings is None:
+            embeddings = np.array([idea.embedding for idea in ideas], dtype=float)
+        embeddings = self._unit_rows(embeddings)
+        query = self._unit_rows(np.asarray(query_embedding, dtype=float).reshape(1, -1))[0]
         
-        # Select first item (highest relevance)
-        first_idx = np.argmax(relevance)
-        selected.append(first_idx)
-        remaining.remove(first_idx)
+        # Compute relevance scores
+        relevance = embeddings @ query
         
-        # Iteratively select diverse items
-        while len(selected) < top_k and remaining:
-            mmr_scores = []
-            
-            for idx in remaining:
-                # Relevance component
-                rel = relevance[idx]
-                
-                # Diversity component (max similarity to selected)
-                max_sim = max(
-                    self.cosine_similarity(ideas[idx].embedding, ideas[s].embedding)
-                    for s in selected
-                )
-                
-                # MMR formula
-                mmr = self.lambda_param * rel - (1 - self.lambda_param) * max_sim
-                mmr_scores.append((idx, mmr))
-            
-            # Select best MMR
-            best_idx, best_mmr = max(mmr_scores, key=lambda x: x[1])
-            selected.append(best_idx)
-            remaining.remove(best_idx)
+        # Greedy MMR selection
+        selected, scores = _mmr_select(embeddings, relevance, self.lambda_param, top_k)
         
-        # Build result
+        # Build result (mmr_score is the score each item was selected with)
         result = []
-        for rank, idx in enumerate(selected, 1):
+        for rank, (idx, score) in enumerate(zip(selected.tolist(), scores.tolist()), 1):
             result.append({
                 "rank": rank,
                 "idea_id": ideas[idx].idea_id,
                 "title": ideas[idx].title,
-                "relevance": relevance[idx],
-                "mmr_score": self.lambda_param * relevance[idx]
+                "relevance": float(relevance[idx]),
+                "mmr_score": score
             })
         
         return result
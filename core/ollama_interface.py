@@ -3,11 +3,77 @@ Ollama Interface Module
 Handles local LLM interactions for embeddings, summaries, and SWOT analysis
 """
 
+import asyncio
+import codecs
+import functools
 import subprocess
 import hashlib
 import json
+import multiprocessing
+import os
+import shutil
+import threading
 import numpy as np
-from typing import Dict, List
+import requests
+from concurrent.futures import ProcessPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional
+
+# httpx import with fallback (async HTTP client for generate_async)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_embedding(text: str, dim: int) -> np.ndarray:
+    """
+    Raw (unnormalized) deterministic embedding for text, memoized per process.
+    Repeated queries skip the md5 + RandomState seeding, which dominates cost.
+    
+    Args:
+        text: Input text
+        dim: Embedding dimension
+        
+    Returns:
+        Read-only vector of shape (dim,); callers must not modify it
+    """
+    hash_val = int(hashlib.md5(text.encode()).hexdigest(), 16)
+    # Local generator (same stream as seeding the global one, but thread-safe)
+    embedding = np.random.RandomState(hash_val % (2**32)).randn(dim)
+    embedding.flags.writeable = False
+    return embedding
+
+
+@functools.lru_cache(maxsize=None)
+def _ollama_path() -> Optional[str]:
+    """
+    Resolve the Ollama CLI executable once per process.
+    CLI fallbacks reuse it instead of searching PATH on every call.
+    
+    Returns:
+        Absolute path to the executable, or None if it is not installed
+    """
+    return shutil.which("ollama")
+
+
+def _hash_embedding_rows(texts: List[str], dim: int) -> np.ndarray:
+    """
+    Raw embeddings for a shard of texts (runs in a worker process).
+    
+    Args:
+        texts: Input texts
+        dim: Embedding dimension
+        
+    Returns:
+        Matrix of shape (len(texts), dim), unnormalized
+    """
+    rows = np.empty((len(texts), dim))
+    for row, text in enumerate(texts):
+        rows[row] = _hash_embedding(text, dim)
+    return rows
 
 
 class OllamaInterface:
@@ -16,28 +82,65 @@ class OllamaInterface:
     Provides embeddings, summaries, and SWOT analysis with fallback to mock mode.
     """
     
-    def __init__(self, model: str = "llama3.2:1b", use_mock: bool = False):
+    # Minimum texts per worker before a batch is sharded across processes
+    # (~1.5s of generation each, so the ~1s worker start-up pays off)
+    EMBEDDING_SHARD_SIZE = 8192
+    
+    def __init__(self, model: str = "llama3.2:1b", use_mock: bool = False,
+                 host: str = "http://localhost:11434"):
         """
         Initialize Ollama interface.
         
         Args:
             model: Ollama model name
             use_mock: Use mock responses if True or if Ollama unavailable
+            host: Base URL of the Ollama HTTP API
         """
         self.model = model
         self.use_mock = use_mock
+        self.host = host
         self.embedding_dim = 384
+        
+        # Keep-alive connection pool reused across HTTP calls
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_maxsize=16))
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=16))
+        self._async_client = None
+        self._async_loop = None
     
     def _call_ollama(self, prompt: str, system: str = "") -> str:
         """
-        Call Ollama CLI and return response.
-        Falls back to mock if unavailable.
+        Call the Ollama daemon over HTTP and return the response.
+        Reuses the keep-alive session instead of forking the CLI per call;
+        falls back to the CLI, then to mock, if the daemon is unreachable.
         """
         if self.use_mock:
             return self._mock_response(prompt)
         
+        payload = {"model": self.model, "prompt": prompt, "stream": False}
+        if system:
+            payload["system"] = system
+        try:
+            response = self._session.post(
+                f"{self.host}/api/generate",
+                json=payload,
+                timeout=(3, 120)
+            )
+            response.raise_for_status()
+            return response.json().get("response", "").strip()
+        except Exception:
+            return self._call_ollama_cli(prompt, system)
+    
+    def _call_ollama_cli(self, prompt: str, system: str = "") -> str:
+        """
+        Call Ollama CLI and return response.
+        Falls back to mock if unavailable.
+        """
+        executable = _ollama_path()
+        if executable is None:
+            return self._mock_response(prompt)
         try:
-            cmd = ["ollama", "run", self.model]
+            cmd = [executable, "run", self.model]
             full_prompt = f"{system}\n\n{prompt}" if system else prompt
             result = subprocess.run(
                 cmd,
@@ -72,13 +175,39 @@ class OllamaInterface:
         Returns:
             Normalized embedding vector
         """
-        # Deterministic embedding based on text hash
-        hash_val = int(hashlib.md5(text.encode()).hexdigest(), 16)
-        np.random.seed(hash_val % (2**32))
-        embedding = np.random.randn(self.embedding_dim)
-        # Normalize to unit vector
+        # Deterministic embedding based on text hash (cached per text)
+        embedding = _hash_embedding(text, self.embedding_dim)
+        # Normalize to unit vector (returns a fresh array, cache stays intact)
         return embedding / np.linalg.norm(embedding)
     
+    def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts in one call.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Matrix of shape (len(texts), embedding_dim), one normalized row per text
+        """
+        # Generation is CPU-bound and holds the GIL: large batches are split
+        # into contiguous shards encoded by worker processes
+        workers = min(os.cpu_count() or 1, len(texts) // self.EMBEDDING_SHARD_SIZE)
+        if workers > 1:
+            bounds = np.linspace(0, len(texts), workers + 1, dtype=int)
+            shards = [texts[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+            # Spawned (not forked) workers are safe while other threads are running
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                embeddings = np.concatenate(list(
+                    pool.map(_hash_embedding_rows, shards, [self.embedding_dim] * workers)
+                ))
+        else:
+            embeddings = _hash_embedding_rows(texts, self.embedding_dim)
+        # Normalize all rows at once, in place (no second (N, d) buffer)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings
+    
     def generate(self, prompt: str) -> str:
         """
         Generate response from Ollama for any prompt.
@@ -91,6 +220,144 @@ class OllamaInterface:
         """
         return self._call_ollama(prompt)
     
+    async def generate_async(self, prompt: str) -> str:
+        """
+        Generate response without blocking the event loop.
+        Uses a pooled keep-alive httpx client when installed, so concurrent
+        calls share connections; otherwise runs generate() in a worker thread.
+        
+        Args:
+            prompt: Input prompt
+            
+        Returns:
+            Generated text response
+        """
+        if self.use_mock:
+            return self._mock_response(prompt)
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.generate, prompt)
+        
+        # Connections are bound to an event loop; one client per loop
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.host,
+                timeout=120,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=16)
+            )
+            self._async_loop = loop
+        
+        try:
+            response = await self._async_client.post(
+                "/api/generate",
+                json={"model": self.model, "prompt": prompt, "stream": False}
+            )
+            response.raise_for_status()
+            return response.json().get("response", "").strip()
+        except Exception:
+            return await asyncio.to_thread(self.generate, prompt)
+    
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream response text from Ollama as tokens are generated.
+        Uses the /api/generate HTTP endpoint with streaming enabled;
+        falls back to a single blocking generate() chunk if unavailable.
+        
+        Args:
+            prompt: Input prompt
+            
+        Yields:
+            Text chunks in generation order
+        """
+        if self.use_mock:
+            yield self._mock_response(prompt)
+            return
+        
+        streamed = False
+        try:
+            with self._session.post(
+                f"{self.host}/api/generate",
+                json={"model": self.model, "prompt": prompt, "stream": True},
+                stream=True,
+                timeout=(3, 60)
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("response"):
+                        streamed = True
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        return
+        except Exception:
+            # Only fall back if nothing was streamed (avoid duplicated text)
+            if not streamed:
+                yield from self._stream_ollama_cli(prompt)
+    
+    def _stream_ollama_cli(self, prompt: str, timeout: float = 120.0) -> Iterator[str]:
+        """
+        Stream response text from the Ollama CLI as it is written to stdout.
+        The process is killed if the caller stops iterating early (or on timeout).
+        Falls back to mock if the CLI is unavailable or fails without output.
+        
+        Args:
+            prompt: Input prompt
+            timeout: Seconds before a still-running process is killed
+            
+        Yields:
+            Text chunks in generation order
+        """
+        executable = _ollama_path()
+        if executable is None:
+            yield self._mock_response(prompt)
+            return
+        try:
+            proc = subprocess.Popen(
+                [executable, "run", self.model],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+        except OSError:
+            yield self._mock_response(prompt)
+            return
+        
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.daemon = True
+        watchdog.start()
+        streamed = False
+        try:
+            try:
+                proc.stdin.write(prompt.encode())
+                proc.stdin.close()
+            except OSError:
+                pass  # Process exited early; its return code decides below
+            
+            # Unbuffered reads return as soon as output is available;
+            # the incremental decoder keeps multi-byte characters intact
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            for data in iter(lambda: proc.stdout.read(1 << 16), b""):
+                text = decoder.decode(data)
+                if text:
+                    streamed = True
+                    yield text
+            text = decoder.decode(b"", final=True)
+            if text:
+                streamed = True
+                yield text
+            
+            if proc.wait() != 0 and not streamed:
+                yield self._mock_response(prompt)
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+    
     def generate_summary(self, text: str, max_words: int = 50) -> str:
         """
         Generate concise summary of text.
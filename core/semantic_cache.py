@@ -0,0 +1,298 @@
+"""Semantic Prompt Cache - Reuse generated ideas for near-duplicate prompts"""
+
+from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta
+import atexit
+import json
+import os
+import threading
+import time
+import numpy as np
+
+# FAISS import with fallback
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+
+class SemanticIdeaCache:
+    """
+    Semantic cache keyed by prompt embedding.
+    Returns previously generated ideas and recommendations when a new prompt
+    is close enough (cosine similarity) to a cached one and was cached under
+    the same context (e.g. model, idea count and database size).
+    Inserts are persisted by a background writer thread, so callers never
+    wait on the disk write. New entries are appended to a JSON-lines journal
+    next to the snapshot file, which is only rewritten when the journal grows
+    past JOURNAL_LIMIT.
+    """
+
+    SAVE_DELAY = 0.5  # seconds; inserts within this window share one disk write
+    JOURNAL_LIMIT = 1 << 20  # bytes; larger journals are compacted into the snapshot
+
+    def __init__(self, path: str = "data/prompt_cache.npz",
+                 threshold: float = 0.85,
+                 max_entries: int = 256,
+                 ttl_hours: float = 24.0):
+        """
+        Initialize semantic cache and load persisted entries.
+
+        Args:
+            path: File used to persist the cache between runs
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum cached prompts (oldest evicted first)
+            ttl_hours: Entries older than this are ignored
+        """
+        self.path = path
+        self.journal_path = path + ".log"
+        self.threshold = max(0.0, min(1.0, threshold))
+        self.max_entries = max(1, max_entries)
+        self.ttl = timedelta(hours=max(0.0, ttl_hours))
+        self.embeddings = None  # (N, d) float32, L2-normalized
+        self.entries: List[Dict[str, Any]] = []
+        self.index = None
+        self._lock = threading.Lock()       # Guards embeddings/entries updates
+        self._save_lock = threading.Lock()  # One disk write at a time
+        self._dirty = threading.Event()     # Set while changes are unsaved
+        self._pending = []                  # (vector, entry) pairs not yet journaled
+        self._journal_bytes = 0             # Current size of the journal file
+        self._writer = None
+        self._load()
+        atexit.register(self.flush)
+
+    def lookup(self, prompt_embedding: np.ndarray,
+               context: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find cached result for a semantically similar prompt.
+
+        Args:
+            prompt_embedding: Embedding of the user prompt
+            context: Values the cached result depends on; only entries
+                inserted with an equal context can be returned
+
+        Returns:
+            Cached entry (prompt, ideas, recommendations, similarity) or None
+        """
+        if not self.entries:
+            return None
+
+        query = self._normalize(prompt_embedding)
+        if query.shape[1] != self.embeddings.shape[1]:
+            return None
+
+        # Walk candidates from most to least similar: the nearest prompt may
+        # have been cached under a different context
+        if self.index is not None:
+            similarities, indices = self.index.search(query, len(self.entries))
+            ranked = zip(indices[0], similarities[0])
+        else:
+            scores = self.embeddings @ query[0]
+            order = np.argsort(-scores, kind="stable")
+            ranked = zip(order, scores[order])
+
+        now = datetime.now()
+        for best, similarity in ranked:
+            if best < 0 or similarity < self.threshold:
+                return None
+            entry = self.entries[best]
+            if entry.get("context") != context:
+                continue
+            if now - datetime.fromisoformat(entry["timestamp"]) > self.ttl:
+                continue
+            return {**entry, "similarity": float(similarity)}
+        return None
+
+    def insert(self, prompt: str, prompt_embedding: np.ndarray,
+               ideas: List[Dict[str, Any]],
+               recommendations: List[Dict[str, Any]],
+               context: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Cache ideas and recommendations for a prompt (persisted in the background).
+
+        Args:
+            prompt: User prompt
+            prompt_embedding: Embedding of the prompt
+            ideas: Generated ideas
+            recommendations: Recommendations returned for the prompt
+            context: Values the result depends on (must be JSON-serializable)
+        """
+        vector = self._normalize(prompt_embedding)
+        entry = {
+            "prompt": str(prompt)[:1000],
+            "ideas": ideas,
+            "recommendations": recommendations,
+            "context": context,
+            "timestamp": datetime.now().isoformat()
+        }
+
+        with self._lock:
+            self._append_entry(vector, entry)
+            self._build_index()
+            self._pending.append((vector, entry))
+        self._schedule_save()
+
+    def flush(self):
+        """Write pending changes to disk now (also runs at interpreter exit)"""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty.is_set():
+                    return
+                self._dirty.clear()
+                pending, self._pending = self._pending, []
+                # Compact when the journal is large: the snapshot already
+                # holds the pending entries, so they are not journaled
+                snapshot = None
+                if self._journal_bytes >= self.JOURNAL_LIMIT:
+                    snapshot = (self.embeddings, list(self.entries))
+            if snapshot is not None:
+                if self._save(*snapshot):
+                    self._clear_journal()
+            else:
+                self._append_journal(pending)
+
+    def _append_entry(self, vector: np.ndarray, entry: Dict[str, Any]):
+        """
+        Add one normalized (1, d) embedding and its entry, evicting the oldest.
+
+        Args:
+            vector: Normalized prompt embedding
+            entry: Cached prompt, ideas, recommendations and timestamp
+        """
+        if self.embeddings is None or self.embeddings.shape[1] != vector.shape[1]:
+            self.embeddings = vector
+            self.entries = [entry]
+        else:
+            self.embeddings = np.vstack([self.embeddings, vector])
+            self.entries.append(entry)
+
+        # Evict oldest entries beyond capacity
+        if len(self.entries) > self.max_entries:
+            self.embeddings = self.embeddings[-self.max_entries:]
+            self.entries = self.entries[-self.max_entries:]
+
+    def _schedule_save(self):
+        """Mark the cache dirty and make sure the background writer is running"""
+        self._dirty.set()
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop,
+                                            name="prompt-cache-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self):
+        """Background writer: coalesce bursts of inserts into one save"""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.SAVE_DELAY)
+            self.flush()
+
+    def _normalize(self, embedding: np.ndarray) -> np.ndarray:
+        """L2-normalize an embedding into a (1, d) float32 row"""
+        vector = np.asarray(embedding, dtype=np.float32).reshape(1, -1).copy()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _build_index(self):
+        """Build inner-product index over cached prompt embeddings"""
+        if not FAISS_AVAILABLE or self.embeddings is None:
+            self.index = None
+            return
+        self.index = faiss.IndexFlatIP(self.embeddings.shape[1])
+        self.index.add(np.ascontiguousarray(self.embeddings))
+
+    def _load(self):
+        """Load persisted snapshot, then replay the journal (ignores missing or corrupt files)"""
+        if os.path.exists(self.path):
+            try:
+                with np.load(self.path, allow_pickle=False) as data:
+                    self.embeddings = data["embeddings"].astype(np.float32)
+                    self.entries = json.loads(str(data["entries"]))
+            except Exception:
+                self.embeddings = None
+                self.entries = []
+
+        if os.path.exists(self.journal_path):
+            try:
+                torn = False
+                with open(self.journal_path, "rb") as f:
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            torn = True  # Interrupted final write
+                            break
+                        self._journal_bytes += len(line)
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue
+                        vector = np.asarray(record["embedding"], dtype=np.float32).reshape(1, -1)
+                        self._append_entry(vector, record["entry"])
+                if torn:
+                    # Cut the partial line so later appends start on a fresh line
+                    os.truncate(self.journal_path, self._journal_bytes)
+            except OSError:
+                pass
+
+        self._build_index()
+
+    def _append_journal(self, pending: List[tuple]):
+        """
+        Append pending entries to the journal, one JSON object per line.
+
+        Args:
+            pending: (vector, entry) pairs in insertion order
+        """
+        if not pending:
+            return
+        lines = "".join(
+            json.dumps({"embedding": vector[0].tolist(), "entry": entry}, default=str) + "\n"
+            for vector, entry in pending
+        ).encode()
+        directory = os.path.dirname(self.journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self.journal_path, "ab") as f:
+                f.write(lines)
+            self._journal_bytes += len(lines)
+        except OSError as e:
+            print(f"⚠️  Could not persist prompt cache: {e}")
+
+    def _clear_journal(self):
+        """Drop the journal once its entries are folded into the snapshot"""
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️  Could not reset prompt cache journal: {e}")
+            return
+        self._journal_bytes = 0
+
+    def _save(self, embeddings: np.ndarray, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Persist a snapshot of the cache to disk (atomically replaces the file).
+
+        Args:
+            embeddings: Cached prompt embeddings
+            entries: Cached entries, aligned with embeddings
+
+        Returns:
+            True if the snapshot was written
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    embeddings=embeddings,
+                    entries=np.array(json.dumps(entries, default=str))
+                )
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            print(f"⚠️  Could not persist prompt cache: {e}")
+            return False
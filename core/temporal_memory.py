@@ -32,6 +32,8 @@ class TemporalMemoryManager:
         
         # Initialize database
         self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self._create_tables()
     
     def _create_tables(self):
@@ -2,6 +2,7 @@
 
 import numpy as np
 from datetime import datetime
+from typing import Sequence
 
 
 class TimeDecayModule:
@@ -29,3 +30,19 @@ class TimeDecayModule:
         days_old = (datetime.now() - timestamp).days
         freshness = np.exp(-self.lambda_decay * days_old)
         return max(0.0, min(1.0, float(freshness)))
+    
+    def calculate_freshness_batch(self, timestamps: Sequence[datetime]) -> np.ndarray:
+        """
+        Freshness scores for many timestamps in one vectorized pass
+        
+        Args:
+            timestamps: Idea timestamps
+            
+        Returns:
+            Array of freshness scores ∈ [0, 1], aligned with timestamps
+        """
+        now = np.datetime64(datetime.now(), "us")
+        stamps = np.array(timestamps, dtype="datetime64[us]")
+        # Floor division matches timedelta.days (whole days, rounded down)
+        days_old = (now - stamps) // np.timedelta64(1, "D")
+        return np.clip(np.exp(-self.lambda_decay * days_old), 0.0, 1.0)
@@ -15,8 +15,48 @@ from core.evaluation import EvaluationDashboard
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import copy
+import functools
+import threading
+import time
 import numpy as np
 
+# uvloop (C event loop on libuv) with fallback to the default asyncio loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# Ranking-time feasibility keyword tables as (keyword, score), built once
+_RANKING_MARKET_INDICATORS = (("global", 0.9), ("national", 0.7), ("local", 0.3), ("niche", 0.4))
+_RANKING_REVENUE_INDICATORS = (("subscription", 0.8), ("saas", 0.85), ("platform", 0.75), ("marketplace", 0.8))
+_RANKING_COST_INDICATORS = (("low-cost", 0.2), ("affordable", 0.3), ("expensive", 0.8), ("hardware", 0.7))
+
+
+@functools.lru_cache(maxsize=4096)
+def _ranking_keyword_features(text: str) -> tuple:
+    """
+    Keyword-derived feasibility features of an idea (memoized per idea text).
+    
+    Args:
+        text: Lowercased idea title and description
+        
+    Returns:
+        Tuple of (market_size, revenue_potential, cost)
+    """
+    market_size = max((score for keyword, score in _RANKING_MARKET_INDICATORS if keyword in text),
+                      default=0.5)
+    revenue_potential = max((score for keyword, score in _RANKING_REVENUE_INDICATORS if keyword in text),
+                            default=0.5)
+    # Cost uses the first matching keyword
+    cost = next((score for keyword, score in _RANKING_COST_INDICATORS if keyword in text), 0.5)
+    return max(market_size, 0.5), max(revenue_potential, 0.5), cost
+
 
 class EnhancedRecommendationEngine(BaseEngine):
     """
@@ -25,6 +65,18 @@ class EnhancedRecommendationEngine(BaseEngine):
     federated learning, blockchain integrity, and more.
     """
     
+    # Per-idea features consumed by causal reasoning (columns of the SoA buffer)
+    CAUSAL_FEATURES = ["sentiment", "trend", "elo", "provenance"]
+    
+    # Exact-match recommendation cache (entries also expire so freshness
+    # decay is picked up by long-running processes)
+    RECOMMENDATION_CACHE_SIZE = 512
+    RECOMMENDATION_CACHE_TTL = 300.0  # seconds
+    
+    # Request limits checked before any embedding or retrieval work
+    MAX_QUERY_LENGTH = 1000
+    MAX_TOP_K = 100
+    
     def __init__(self, db_path: str = "data/ideas.db", ollama_model: str = "llama2"):
         """
         Initialize enhanced engine with all modules.
@@ -47,13 +99,29 @@ class EnhancedRecommendationEngine(BaseEngine):
         self.twin_generator = IdeaTwinGenerator()
         self.evaluation_dashboard = EvaluationDashboard()
         
+        # SoA buffer of normalized causal features, filled at insert time
+        self._causal_F = np.empty((64, len(self.CAUSAL_FEATURES)))
+        self._causal_rows = {}  # idea_id -> row index in _causal_F
+        
+        # Serializes writes to database, blockchain and temporal memory
+        self._write_lock = threading.Lock()
+        
+        # (query, top_k, flags, view) -> (created_at, recommendations), LRU order
+        self._recommendation_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         print("✅ Enhanced Recommendation Engine initialized with 27 modules")
     
     def add_idea_enhanced(self, title: str, description: str, author: str = "system",
-                         tags: Optional[List[str]] = None) -> Dict[str, Any]:
+                         tags: Optional[List[str]] = None,
+                         precomputed_embedding: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Add idea with enhanced pre-processing pipeline.
         
+        Args:
+            precomputed_embedding: Optional embedding of the description
+                (e.g. from a batched generate_embeddings call)
+        
         Returns:
             Dictionary with idea_id, blockchain hash, and ethics assessment
         """
@@ -71,8 +139,13 @@ class EnhancedRecommendationEngine(BaseEngine):
                 "ethics_assessment": ethics_result
             }
         
-        # Add idea using base method
-        idea_id = self.add_idea(title, description, author, tags)
+        # Embed and score once; the same Idea object feeds every later stage
+        idea = self._build_idea(title, description, tags,
+                                precomputed_embedding=precomputed_embedding)
+        
+        # Store idea (shared stores are written under a lock)
+        with self._write_lock:
+            idea_id = self._store_idea(idea)
         
         # Check if idea was added (None means duplicate)
         if not idea_id:
@@ -82,19 +155,9 @@ class EnhancedRecommendationEngine(BaseEngine):
                 "duplicate": True
             }
         
-        # Get the idea object
-        idea = self.db.get_idea_by_id(idea_id)
-        
-        if not idea:
-            return {
-                "success": False,
-                "error": "Failed to retrieve added idea"
-            }
-        
         # Economic feasibility analysis with dynamic feature extraction
         # Extract features from title and description
-        title_lower = title.lower()
-        desc_lower = description.lower()
+        text = idea.lower_text
         
         # Market size estimation based on keywords
         market_indicators = {
@@ -104,7 +167,7 @@ class EnhancedRecommendationEngine(BaseEngine):
         }
         market_size = 0.5  # Default
         for keyword, score in market_indicators.items():
-            if keyword in title_lower or keyword in desc_lower:
+            if keyword in text:
                 market_size = max(market_size, score)
         
         # Revenue potential based on business model keywords
@@ -116,7 +179,7 @@ class EnhancedRecommendationEngine(BaseEngine):
         }
         revenue_potential = 0.5  # Default
         for keyword, score in revenue_indicators.items():
-            if keyword in title_lower or keyword in desc_lower:
+            if keyword in text:
                 revenue_potential = max(revenue_potential, score)
         
         # Cost estimation (inverse - lower is better)
@@ -130,7 +193,7 @@ class EnhancedRecommendationEngine(BaseEngine):
         }
         cost = 0.5  # Default medium cost
         for keyword, score in cost_indicators.items():
-            if keyword in title_lower or keyword in desc_lower:
+            if keyword in text:
                 cost = score
                 break  # Use first match
         
@@ -153,28 +216,32 @@ class EnhancedRecommendationEngine(BaseEngine):
             "regulatory_risk": 0.3
         })
         
-        # Store embedding in temporal memory
-        self.temporal_memory.store_embedding(
-            idea_id,
-            idea.embedding,
-            metadata={
-                "title": title,
-                "author": author,
-                "tags": tags or []
-            }
-        )
-        
-        # Add to blockchain for integrity
-        blockchain_hash = self.blockchain.add_block(
-            idea_id,
-            idea.hash_signature,
-            metadata={
-                "title": title,
-                "author": author,
-                "ethics_score": ethics_result["ethical_score"],
-                "feasibility_score": feasibility["feasibility_score"]
-            }
-        )
+        with self._write_lock:
+            # Precompute normalized causal features for ranking
+            self._store_causal_features(idea)
+            
+            # Store embedding in temporal memory
+            self.temporal_memory.store_embedding(
+                idea_id,
+                idea.embedding,
+                metadata={
+                    "title": title,
+                    "author": author,
+                    "tags": tags or []
+                }
+            )
+            
+            # Add to blockchain for integrity
+            blockchain_hash = self.blockchain.add_block(
+                idea_id,
+                idea.hash_signature,
+                metadata={
+                    "title": title,
+                    "author": author,
+                    "ethics_score": ethics_result["ethical_score"],
+                    "feasibility_score": feasibility["feasibility_score"]
+                }
+            )
         
         return {
             "success": True,
@@ -185,6 +252,80 @@ class EnhancedRecommendationEngine(BaseEngine):
             "adjustment_factor": ethics_result["adjustment_factor"]
         }
     
+    async def add_ideas_enhanced_async(self, ideas: List[Dict[str, Any]],
+                                       max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """
+        Run the add_idea_enhanced pipeline for several ideas concurrently.
+        Each blocking pipeline runs in a worker thread, bounded by a semaphore.
+        
+        Args:
+            ideas: List of keyword-argument dicts for add_idea_enhanced
+            max_concurrency: Maximum pipelines in flight
+            
+        Returns:
+            Pipeline results in the same order as ideas
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # Fast path: duplicate titles and text-level spam skip the whole
+        # pipeline (including the batched embedding below). Titles repeated
+        # within the call keep their first occurrence, like sequential adds
+        seen = self.db.existing_titles([idea["title"] for idea in ideas])
+        results = []
+        for idea in ideas:
+            if idea["title"] in seen:
+                results.append({"success": False, "error": "Duplicate idea already exists",
+                                "duplicate": True})
+                continue
+            if not self.fairness.filter_adversarial_text(idea["description"]):
+                results.append({"success": False, "error": "Idea flagged as adversarial/spam"})
+                continue
+            seen.add(idea["title"])
+            results.append(None)
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
+        # Embed all remaining descriptions in one batch up front
+        embeddings = self.ollama.generate_embeddings([ideas[i]["description"] for i in pending])
+        
+        async def controlled_add(idea: Dict[str, Any], embedding: np.ndarray) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self.add_idea_enhanced, **idea, precomputed_embedding=embedding
+                    )
+                except Exception as e:
+                    # One failing pipeline must not discard the other results
+                    return {"success": False, "error": str(e)}
+        
+        # One transaction for all inserts instead of a commit per idea
+        with self.db.batch():
+            added = await asyncio.gather(
+                *(controlled_add(ideas[i], embedding) for i, embedding in zip(pending, embeddings))
+            )
+        for i, result in zip(pending, added):
+            results[i] = result
+        return results
+    
+    def add_ideas_enhanced(self, ideas: List[Dict[str, Any]],
+                           max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """
+        Synchronous entry point for add_ideas_enhanced_async.
+        Runs on uvloop when installed, otherwise on the default asyncio loop.
+        
+        Args:
+            ideas: List of keyword-argument dicts for add_idea_enhanced
+            max_concurrency: Maximum pipelines in flight
+            
+        Returns:
+            Pipeline results in the same order as ideas
+        """
+        coro = self.add_ideas_enhanced_async(ideas, max_concurrency)
+        if UVLOOP_AVAILABLE:
+            return uvloop.run(coro)
+        return asyncio.run(coro)
+    
     def get_recommendations_enhanced(self, query: str, top_k: int = 10,
                                     use_causal: bool = True,
                                     use_feasibility: bool = True,
@@ -202,56 +343,51 @@ class EnhancedRecommendationEngine(BaseEngine):
         Returns:
             Enhanced recommendations with additional scores
         """
+        query, top_k = self._validate_request(query, top_k)
+        
+        # Repeated requests skip embedding, retrieval and scoring entirely
+        cache_key = (query, top_k, use_causal, use_feasibility, view)
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._recommendation_cache.get(cache_key)
+            if cached is not None and now - cached[0] < self.RECOMMENDATION_CACHE_TTL:
+                self._recommendation_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached[1])
+        
         # Get base recommendations
-        base_results = self.get_recommendations(query, top_k * 2, view, use_mmr=True)
+        base_results = self.get_recommendations(query, top_k * 2, view, use_mmr=True,
+                                                include_idea=True)
+        
+        # Causal impact for all candidates in one vectorized pass
+        if use_causal:
+            rows = [self._store_causal_features(r["_idea"]) for r in base_results]
+            causal_scores = self.causal_reasoning.compute_causal_impact_scores(
+                self._causal_F[rows], self.CAUSAL_FEATURES
+            )
         
-        # Enhance each result
-        enhanced_results = []
+        # Per-candidate score components (one array each), fused below
+        n = len(base_results)
+        # Reuse the Idea objects already loaded by the base engine
+        ideas = [result.pop("_idea") for result in base_results]
+        final_scores = np.array([result["final_score"] for result in base_results], dtype=float)
+        ethics_factors = np.empty(n)
+        ethics_results = []
+        feasibility_scores = np.full(n, 0.5)
         
-        for result in base_results:
-            idea_id = result["idea_id"]
-            idea = self.db.get_idea_by_id(idea_id)
-            
-            if not idea:
-                continue
-            
+        for i, idea in enumerate(ideas):
             # Ethics check
             ethics_result = self.ethics_filter.flagged(
                 f"{idea.title} {idea.description}",
                 metadata={"tags": idea.tags}
             )
-            
-            # Apply ethics adjustment
-            adjusted_score = result["final_score"] * ethics_result["adjustment_factor"]
+            ethics_results.append(ethics_result)
+            ethics_factors[i] = ethics_result["adjustment_factor"]
             
             # Economic feasibility with dynamic feature extraction
-            feasibility_score = 0.5
             if use_feasibility:
-                # Extract features from idea
-                title_lower = idea.title.lower()
-                desc_lower = idea.description.lower() if idea.description else ""
-                
-                # Market size estimation
-                market_indicators = {'global': 0.9, 'national': 0.7, 'local': 0.3, 'niche': 0.4}
-                market_size = 0.5
-                for keyword, score in market_indicators.items():
-                    if keyword in title_lower or keyword in desc_lower:
-                        market_size = max(market_size, score)
-                
-                # Revenue potential
-                revenue_indicators = {'subscription': 0.8, 'saas': 0.85, 'platform': 0.75, 'marketplace': 0.8}
-                revenue_potential = 0.5
-                for keyword, score in revenue_indicators.items():
-                    if keyword in title_lower or keyword in desc_lower:
-                        revenue_potential = max(revenue_potential, score)
-                
-                # Cost estimation
-                cost_indicators = {'low-cost': 0.2, 'affordable': 0.3, 'expensive': 0.8, 'hardware': 0.7}
-                cost = 0.5
-                for keyword, score in cost_indicators.items():
-                    if keyword in title_lower or keyword in desc_lower:
-                        cost = score
-                        break
+                # Market size, revenue potential and cost from idea keywords
+                # (tables are module constants; results cached per idea text)
+                market_size, revenue_potential, cost = _ranking_keyword_features(idea.lower_text)
                 
                 feasibility = self.economic_feasibility.analyze_feasibility({
                     "market_size": market_size,
@@ -265,42 +401,96 @@ class EnhancedRecommendationEngine(BaseEngine):
                     "volatility": 0.5,
                     "regulatory_risk": 0.3
                 })
-                feasibility_score = feasibility["feasibility_score"]
-                adjusted_score = adjusted_score * 0.8 + feasibility_score * 0.2
-            
-            # Causal impact
-            causal_impact = 0.0
-            if use_causal:
-                causal_features = {
-                    "sentiment": idea.sentiment,
-                    "trend": idea.trend_score,
-                    "elo": idea.elo_rating / 1500.0,
-                    "provenance": idea.provenance_score
-                }
-                causal_impact = self.causal_reasoning.compute_causal_impact_score(causal_features)
-                adjusted_score = adjusted_score * 0.9 + causal_impact * 0.1
-            
-            # Blockchain verification
-            blockchain_verified = self.blockchain.verify_idea_hash(idea_id, idea.hash_signature)
-            
-            enhanced_results.append({
-                **result,
-                "adjusted_final_score": float(adjusted_score),
+                feasibility_scores[i] = feasibility["feasibility_score"]
+        
+        # Fuse ethics, feasibility and causal adjustments in one vectorized pass
+        adjusted_scores = final_scores * ethics_factors
+        if use_feasibility:
+            adjusted_scores = adjusted_scores * 0.8 + feasibility_scores * 0.2
+        causal_impacts = np.zeros(n)
+        if use_causal:
+            causal_impacts = np.asarray(causal_scores, dtype=float)
+            adjusted_scores = adjusted_scores * 0.9 + causal_impacts * 0.1
+        
+        # Top-k by adjusted score (stable, like heapq.nlargest); result dicts
+        # and blockchain checks are only built for the candidates kept.
+        # Partition to the k-th best score first and sort only the rows at or
+        # above it (index order keeps ties resolved like the full stable sort)
+        if 0 < top_k < n:
+            kth_score = -np.partition(-adjusted_scores, top_k - 1)[top_k - 1]
+            order = np.flatnonzero(adjusted_scores >= kth_score)
+            order = order[np.argsort(-adjusted_scores[order], kind="stable")][:top_k]
+        else:
+            order = np.argsort(-adjusted_scores, kind="stable")[:top_k]
+        top_results = []
+        for rank, i in enumerate(order, 1):
+            idea = ideas[i]
+            ethics_result = ethics_results[i]
+            top_results.append({
+                **base_results[i],
+                "adjusted_final_score": float(adjusted_scores[i]),
                 "ethics_score": float(ethics_result["ethical_score"]),
                 "ethics_compliance": float(ethics_result["compliance_score"]),
-                "feasibility_score": float(feasibility_score),
-                "causal_impact": float(causal_impact),
-                "blockchain_verified": blockchain_verified
+                "feasibility_score": float(feasibility_scores[i]),
+                "causal_impact": float(causal_impacts[i]),
+                # Blockchain verification
+                "blockchain_verified": self.blockchain.verify_idea_hash(idea.idea_id,
+                                                                        idea.hash_signature),
+                "rank": rank
             })
         
-        # Re-sort by adjusted score
-        enhanced_results.sort(key=lambda x: x["adjusted_final_score"], reverse=True)
+        with self._cache_lock:
+            self._recommendation_cache[cache_key] = (now, copy.deepcopy(top_results))
+            self._recommendation_cache.move_to_end(cache_key)
+            while len(self._recommendation_cache) > self.RECOMMENDATION_CACHE_SIZE:
+                self._recommendation_cache.popitem(last=False)
+        
+        return top_results
+    
+    def _validate_request(self, query: str, top_k: int):
+        """
+        Normalize and bound-check a recommendation request.
         
-        # Update ranks
-        for i, result in enumerate(enhanced_results[:top_k], 1):
-            result["rank"] = i
+        Surrounding whitespace is stripped so equivalent queries share a
+        cache entry; malformed requests fail before the embedding call.
         
-        return enhanced_results[:top_k]
+        Args:
+            query: User query
+            top_k: Number of results
+            
+        Returns:
+            Tuple of (stripped query, top_k)
+        """
+        if not isinstance(query, str):
+            raise ValueError(f"query must be a string, got {type(query).__name__}")
+        query = query.strip()
+        if not query:
+            raise ValueError("query cannot be empty")
+        if len(query) > self.MAX_QUERY_LENGTH:
+            raise ValueError(f"query exceeds {self.MAX_QUERY_LENGTH} characters")
+        if isinstance(top_k, bool) or not isinstance(top_k, (int, np.integer)):
+            raise ValueError(f"top_k must be an integer, got {type(top_k).__name__}")
+        if not 1 <= top_k <= self.MAX_TOP_K:
+            raise ValueError(f"top_k must be between 1 and {self.MAX_TOP_K}")
+        return query, int(top_k)
+    
+    def clear_recommendation_cache(self):
+        """Drop cached recommendations (called whenever ideas or their scores change)"""
+        with self._cache_lock:
+            self._recommendation_cache.clear()
+    
+    def _store_idea(self, idea) -> str:
+        """Store an idea and invalidate cached recommendations"""
+        idea_id = super()._store_idea(idea)
+        if idea_id:
+            self.clear_recommendation_cache()
+        return idea_id
+    
+    def submit_feedback(self, idea_id: str, feedback_type: str,
+                       value: float, context: Optional[Dict] = None):
+        """Submit user feedback and invalidate cached recommendations"""
+        super().submit_feedback(idea_id, feedback_type, value, context)
+        self.clear_recommendation_cache()
     
     def submit_federated_feedback(self, user_id: str, 
                                   idea_feedbacks: Dict[str, float]) -> Dict[str, Any]:
@@ -378,16 +568,25 @@ class EnhancedRecommendationEngine(BaseEngine):
     
     def generate_comprehensive_report(self) -> Dict[str, Any]:
         """Generate comprehensive system report with all metrics"""
-        # Base audit
-        base_audit = self.generate_audit_report()
-        
-        # Blockchain integrity
-        blockchain_summary = self.blockchain.get_chain_summary()
-        blockchain_integrity = self.blockchain.verify_chain_integrity()
-        
-        # Temporal memory stats
-        recent_contexts = len(self.temporal_memory.retrieve_recent_context(hours_back=24))
-        recent_embeddings = len(self.temporal_memory.retrieve_temporal_embeddings(hours_back=168))
+        # Independent subsystems (each with its own store) are queried concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Base audit
+            audit_future = executor.submit(self.generate_audit_report)
+            
+            # Blockchain integrity
+            blockchain_future = executor.submit(
+                lambda: (self.blockchain.get_chain_summary(), self.blockchain.verify_chain_integrity())
+            )
+            
+            # Temporal memory stats
+            temporal_future = executor.submit(
+                lambda: (len(self.temporal_memory.retrieve_recent_context(hours_back=24)),
+                         len(self.temporal_memory.retrieve_temporal_embeddings(hours_back=168)))
+            )
+            
+            base_audit = audit_future.result()
+            blockchain_summary, blockchain_integrity = blockchain_future.result()
+            recent_contexts, recent_embeddings = temporal_future.result()
         
         # Federated feedback stats
         fed_history_count = len(self.federated_feedback.update_history)
@@ -416,6 +615,32 @@ class EnhancedRecommendationEngine(BaseEngine):
             }
         }
     
+    def _store_causal_features(self, idea) -> int:
+        """
+        Write an idea's normalized causal features into the SoA buffer.
+        
+        Args:
+            idea: Idea object
+            
+        Returns:
+            Row index of the idea in the buffer
+        """
+        row = self._causal_rows.get(idea.idea_id)
+        if row is None:
+            row = len(self._causal_rows)
+            if row == len(self._causal_F):
+                # Grow capacity geometrically
+                self._causal_F = np.concatenate([self._causal_F, np.empty_like(self._causal_F)])
+            self._causal_rows[idea.idea_id] = row
+        
+        self._causal_F[row] = (
+            idea.sentiment,
+            idea.trend_score,
+            idea.elo_rating / 1500.0,
+            idea.provenance_score
+        )
+        return row
+    
     def _feedback_to_weights(self, feedbacks: Dict[str, float]) -> Dict[str, float]:
         """Convert feedback signals to weight updates"""
         # Simplified: adjust weights based on average feedback
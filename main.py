@@ -3,11 +3,18 @@ Main Entry Point - AI-Powered Idea Recommendation System
 Generate and recommend ideas based on prompts with full pipeline execution
 """
 
-from enhanced_engine import EnhancedRecommendationEngine
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import argparse
+import contextlib
+import functools
+import json
+import re
 import sys
 import os
 
+from cli_utils import buffered_output
+
 
 def print_banner():
     """Print welcome banner"""
@@ -26,7 +33,8 @@ def print_section(title: str):
     print(f"{'─' * 80}")
 
 
-def generate_ideas_from_prompt(engine, prompt: str, num_ideas: int = 3) -> list:
+def generate_ideas_from_prompt(engine, prompt: str, num_ideas: int = 3,
+                               on_idea=None) -> list:
     """
     Generate multiple ideas using Ollama based on user prompt
     
@@ -34,6 +42,8 @@ def generate_ideas_from_prompt(engine, prompt: str, num_ideas: int = 3) -> list:
         engine: EnhancedRecommendationEngine instance
         prompt: User's idea generation prompt
         num_ideas: Number of ideas to generate
+        on_idea: Optional callback invoked with each idea as soon as it has
+            streamed in (not called for fallback ideas)
         
     Returns:
         List of generated idea dictionaries
@@ -42,7 +52,41 @@ def generate_ideas_from_prompt(engine, prompt: str, num_ideas: int = 3) -> list:
     print(f"Prompt: \"{prompt}\"\n")
     
     # Generate ideas using Ollama
-    generation_prompt = f"""Generate {num_ideas} unique and innovative startup/project ideas based on this theme: "{prompt}"
+    generation_prompt = build_generation_prompt(prompt, num_ideas)
+
+    print("🤖 Ollama is generating ideas... (this may take 30-60 seconds)\n")
+    
+    try:
+        # Parse ideas incrementally as tokens stream in
+        ideas = []
+        for idea in stream_ollama_ideas(engine.ollama.generate_stream(generation_prompt), prompt):
+            ideas.append(idea)
+            print(f"  💡 Idea {len(ideas)} ready: {idea['title'][:60]}")
+            if on_idea is not None:
+                on_idea(idea)
+        
+        if not ideas:
+            # Fallback if parsing fails
+            print("⚠️  Using fallback idea generation...")
+            ideas = generate_fallback_ideas(prompt, num_ideas)
+        
+        return ideas
+        
+    except Exception as e:
+        print(f"⚠️  Ollama error: {e}")
+        if ideas:
+            # Keep what streamed in before the failure (may already be processing)
+            return ideas
+        print("Using fallback idea generation...\n")
+        return generate_fallback_ideas(prompt, num_ideas)
+
+
+# Idea generation prompt; only the header line varies per call
+_GENERATION_PROMPT_HEADER = (
+    'Generate {num_ideas} unique and innovative startup/project ideas '
+    'based on this theme: "{prompt}"'
+)
+_GENERATION_PROMPT_BODY = """
 
 For each idea, provide:
 1. A clear title (5-10 words)
@@ -59,29 +103,100 @@ IDEA 2:
 ...
 """
 
-    print("🤖 Ollama is generating ideas... (this may take 30-60 seconds)\n")
+
+@functools.lru_cache(maxsize=256)
+def build_generation_prompt(prompt: str, num_ideas: int) -> str:
+    """
+    Build the Ollama idea generation prompt (memoized per prompt/count)
     
-    try:
-        ollama_response = engine.ollama.generate(generation_prompt)
-        
-        # Parse Ollama response to extract ideas
-        ideas = parse_ollama_ideas(ollama_response, prompt)
-        
-        if not ideas:
-            # Fallback if parsing fails
-            print("⚠️  Using fallback idea generation...")
-            ideas = generate_fallback_ideas(prompt, num_ideas)
+    Args:
+        prompt: User's idea generation prompt
+        num_ideas: Number of ideas to request
         
-        return ideas
+    Returns:
+        Full generation prompt text
+    """
+    header = _GENERATION_PROMPT_HEADER.format_map({"num_ideas": num_ideas, "prompt": prompt})
+    return header + _GENERATION_PROMPT_BODY
+
+
+def _tags_line_end(text: str, start: int) -> int:
+    """Return the index just past a completed "Tags:" line after start, or -1"""
+    tags_pos = text.find("Tags:", start)
+    if tags_pos == -1:
+        return -1
+    newline = text.find("\n", tags_pos)
+    return newline + 1 if newline != -1 else -1
+
+
+def stream_ollama_ideas(chunks, theme: str, max_ideas: int = 5):
+    """
+    Incrementally parse streamed Ollama text into ideas
+    
+    Args:
+        chunks: Iterable of generated text chunks
+        theme: Prompt theme (used for default tags)
+        max_ideas: Maximum number of ideas to yield
         
-    except Exception as e:
-        print(f"⚠️  Ollama error: {e}")
-        print("Using fallback idea generation...\n")
-        return generate_fallback_ideas(prompt, num_ideas)
+    Yields:
+        Idea dictionaries as soon as each IDEA block is complete
+    """
+    buffer = ""
+    emitted = 0
+    
+    def drain(final: bool):
+        nonlocal buffer
+        while True:
+            start = buffer.find("IDEA")
+            if start == -1:
+                return
+            # A block is complete once the next IDEA marker arrives or its Tags line ends
+            end = buffer.find("IDEA", start + 4)
+            if end == -1:
+                end = _tags_line_end(buffer, start)
+            if end == -1:
+                if not final:
+                    return
+                end = len(buffer)
+            block, buffer = buffer[start:end], buffer[end:]
+            yield from parse_ollama_ideas(block, theme)
+    
+    for chunk in chunks:
+        buffer += chunk
+        for idea in drain(final=False):
+            yield idea
+            emitted += 1
+            if emitted >= max_ideas:
+                return
+    
+    for idea in drain(final=True):
+        yield idea
+        emitted += 1
+        if emitted >= max_ideas:
+            return
 
 
 def parse_ollama_ideas(ollama_text: str, theme: str) -> list:
-    """Parse Ollama response into structured ideas"""
+    """Parse Ollama response into structured ideas (memoized on identical text)"""
+    return [
+        {
+            "title": title,
+            "description": description,
+            "tags": list(tags),
+            "author": "AI-Generated"
+        }
+        for title, description, tags in _parse_ollama_ideas_cached(ollama_text, theme)
+    ]
+
+
+# "Title: ...", "Description: ..." and "Tags: ..." lines of an IDEA block,
+# matched across a whole section in one pass of the C regex engine
+_FIELD_LINE_RE = re.compile(r"^[^\S\n]*(Title|Description|Tags):[^\S\n]*(.*)", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ollama_ideas_cached(ollama_text: str, theme: str) -> tuple:
+    """Parse Ollama response into immutable (title, description, tags) tuples"""
     ideas = []
     
     try:
@@ -91,19 +206,15 @@ def parse_ollama_ideas(ollama_text: str, theme: str) -> list:
         for idx, section in enumerate(sections[:5]):  # Max 5 ideas
             lines = section.strip().split('\n')
             
-            title = ""
-            description = ""
-            tags = []
+            # Later lines win, as with a per-line scan
+            fields = {
+                match.group(1): match.group(2).strip()
+                for match in _FIELD_LINE_RE.finditer(section)
+            }
             
-            for line in lines:
-                line = line.strip()
-                if line.startswith("Title:"):
-                    title = line.replace("Title:", "").strip()
-                elif line.startswith("Description:"):
-                    description = line.replace("Description:", "").strip()
-                elif line.startswith("Tags:"):
-                    tags_text = line.replace("Tags:", "").strip()
-                    tags = [t.strip() for t in tags_text.split(',')]
+            title = fields.get("Title", "")
+            description = fields.get("Description", "")
+            tags = [t.strip() for t in fields["Tags"].split(',')] if "Tags" in fields else []
             
             # If description is too short, accumulate next lines
             if description and len(description) < 50:
@@ -112,72 +223,102 @@ def parse_ollama_ideas(ollama_text: str, theme: str) -> list:
                         description += " " + line.strip()
             
             if title and description:
-                ideas.append({
-                    "title": title[:200],  # Limit title length
-                    "description": description[:1000],  # Limit description
-                    "tags": tags[:5] if tags else [theme, "innovative", "startup"],
-                    "author": "AI-Generated"
-                })
+                ideas.append((
+                    title[:200],  # Limit title length
+                    description[:1000],  # Limit description
+                    tuple(tags[:5]) if tags else (theme, "innovative", "startup")
+                ))
     
     except Exception as e:
         print(f"⚠️  Parsing error: {e}")
-        return []
+        return ()
     
-    return ideas
+    return tuple(ideas)
+
+
+# Fallback templates, formatted with {theme} / {Theme} per call
+_FALLBACK_TEMPLATES = (
+    (
+        "{Theme} Platform with AI Integration",
+        "An innovative platform that leverages artificial intelligence to enhance {theme}. The solution uses machine learning algorithms to optimize user experience, provide personalized recommendations, and automate complex workflows. Features include real-time analytics, predictive modeling, and seamless integration with existing tools.",
+        ("AI", "platform", "innovation", "automation")
+    ),
+    (
+        "Sustainable {Theme} Ecosystem",
+        "A comprehensive ecosystem focused on sustainable {theme} practices. This solution addresses environmental concerns while maintaining efficiency and profitability. Incorporates renewable resources, circular economy principles, and transparent supply chains with blockchain verification.",
+        ("sustainability", "ecosystem", "green-tech", "blockchain")
+    ),
+    (
+        "Decentralized {Theme} Network",
+        "A decentralized network that democratizes access to {theme} services. Built on blockchain technology, this platform ensures transparency, security, and fair distribution of resources. Smart contracts automate transactions while maintaining user privacy and data ownership.",
+        ("decentralized", "blockchain", "web3", "privacy")
+    )
+)
 
 
 def generate_fallback_ideas(theme: str, num_ideas: int) -> list:
     """Generate fallback ideas if Ollama fails"""
-    fallback_templates = [
+    return [
         {
-            "title": f"{theme.title()} Platform with AI Integration",
-            "description": f"An innovative platform that leverages artificial intelligence to enhance {theme}. The solution uses machine learning algorithms to optimize user experience, provide personalized recommendations, and automate complex workflows. Features include real-time analytics, predictive modeling, and seamless integration with existing tools.",
-            "tags": [theme, "AI", "platform", "innovation", "automation"]
-        },
-        {
-            "title": f"Sustainable {theme.title()} Ecosystem",
-            "description": f"A comprehensive ecosystem focused on sustainable {theme} practices. This solution addresses environmental concerns while maintaining efficiency and profitability. Incorporates renewable resources, circular economy principles, and transparent supply chains with blockchain verification.",
-            "tags": [theme, "sustainability", "ecosystem", "green-tech", "blockchain"]
-        },
-        {
-            "title": f"Decentralized {theme.title()} Network",
-            "description": f"A decentralized network that democratizes access to {theme} services. Built on blockchain technology, this platform ensures transparency, security, and fair distribution of resources. Smart contracts automate transactions while maintaining user privacy and data ownership.",
-            "tags": [theme, "decentralized", "blockchain", "web3", "privacy"]
+            "author": "AI-Generated",
+            "title": title,
+            "description": description,
+            "tags": list(tags)
         }
+        for title, description, tags in _fallback_ideas_cached(theme)[:num_ideas]
     ]
-    
-    return [{"author": "AI-Generated", **template} for template in fallback_templates[:num_ideas]]
 
 
-def add_ideas_to_system(engine, ideas: list) -> list:
-    """Add generated ideas to the system with full pipeline"""
+@functools.lru_cache(maxsize=64)
+def _fallback_ideas_cached(theme: str) -> tuple:
+    """Formatted fallback templates for a theme (frozen; callers get fresh dicts)"""
+    fields = {"theme": theme, "Theme": theme.title()}
+    return tuple(
+        (title.format_map(fields), description.format_map(fields), (theme, *tags))
+        for title, description, tags in _FALLBACK_TEMPLATES
+    )
+
+
+def add_ideas_to_system(engine, ideas: list, results: list = None) -> list:
+    """
+    Add generated ideas to the system with full pipeline
+    
+    Args:
+        engine: EnhancedRecommendationEngine instance
+        ideas: Generated idea dictionaries
+        results: Pipeline results already computed for ideas (e.g. while
+            generation was still streaming); computed here when None
+        
+    Returns:
+        Results of the successfully added ideas
+    """
     print_section("ADDING IDEAS TO SYSTEM (Full Pipeline)")
     print("Pipeline: Ethics Filter → Feasibility Analysis → Database → Blockchain → Temporal Memory\n")
     
     added_ideas = []
     
-    for idx, idea in enumerate(ideas, 1):
-        print(f"[{idx}/{len(ideas)}] Processing: {idea['title'][:60]}...")
-        
-        # Check for duplicates (skip check for now, add_idea_enhanced will handle it)
-        # Note: Duplicate detection is done at database level during add_idea_enhanced
-        
-        # Add with enhanced pipeline
-        result = engine.add_idea_enhanced(**idea)
-        
-        if result["success"]:
-            added_ideas.append(result)
-            print(f"  ✅ Successfully added")
-            print(f"     ID: {result['idea_id'][:16]}...")
-            print(f"     Ethics: {result['ethics_assessment']['ethical_score']:.3f} | "
-                  f"Compliance: {result['ethics_assessment']['compliance_score']:.3f}")
-            print(f"     Feasibility: {result['feasibility_analysis']['feasibility_score']:.3f} | "
-                  f"ROI: {result['feasibility_analysis']['roi_level']} | "
-                  f"Risk: {result['feasibility_analysis']['risk_level']}")
-            print(f"     Blockchain: {result['blockchain_hash'][:24]}...")
-            print()
-        else:
-            print(f"  ❌ Blocked: {result.get('error', 'Unknown error')}\n")
+    if results is None:
+        # Run the enhanced pipelines concurrently
+        # Note: Titles already in the database are skipped before any embedding or scoring
+        results = engine.add_ideas_enhanced(ideas)
+    
+    with buffered_output():
+        for idx, (idea, result) in enumerate(zip(ideas, results), 1):
+            print(f"[{idx}/{len(ideas)}] Processed: {idea['title'][:60]}...")
+            
+            if result["success"]:
+                added_ideas.append(result)
+                print(f"  ✅ Successfully added")
+                print(f"     ID: {result['idea_id'][:16]}...")
+                print(f"     Ethics: {result['ethics_assessment']['ethical_score']:.3f} | "
+                      f"Compliance: {result['ethics_assessment']['compliance_score']:.3f}")
+                print(f"     Feasibility: {result['feasibility_analysis']['feasibility_score']:.3f} | "
+                      f"ROI: {result['feasibility_analysis']['roi_level']} | "
+                      f"Risk: {result['feasibility_analysis']['risk_level']}")
+                print(f"     Blockchain: {result['blockchain_hash'][:24]}...")
+                print()
+            else:
+                print(f"  ❌ Blocked: {result.get('error', 'Unknown error')}\n")
     
     return added_ideas
 
@@ -195,49 +336,80 @@ def get_recommendations(engine, query: str, top_k: int = 5):
         use_feasibility=True
     )
     
+    display_recommendations(recommendations)
+    return recommendations
+
+
+def display_recommendations(recommendations: list):
+    """Display recommendations table and detailed view of the top one"""
+    with buffered_output():
+        _print_recommendations(recommendations)
+
+
+# Recommendations table layout (column widths shared by header and rows)
+_TABLE_HEADER = f"{'Rank':<6} {'Title':<40} {'Score':<8} {'Ethics':<8} {'Feasibility':<12} {'Blockchain':<12}"
+_TABLE_ROW = "{rank:<6} {title:<40} {score:<8.4f} {ethics:<8.4f} {feasibility:<12.4f} {blockchain:<12}".format
+
+# Detailed score block for the top recommendation
+_TOP_DETAILS = (
+    "\n🏆 TOP RECOMMENDATION: {rec[title]}\n"
+    "   Author: {rec[author]}\n"
+    "   Tags: {tags}\n"
+    "\n   📊 DETAILED SCORES:\n"
+    "      Base Score:           {rec[final_score]:.4f}\n"
+    "      Adjusted Score:       {rec[adjusted_final_score]:.4f}\n"
+    "      Ethics Score:         {rec[ethics_score]:.4f}\n"
+    "      Ethics Compliance:    {rec[ethics_compliance]:.4f}\n"
+    "      Feasibility Score:    {rec[feasibility_score]:.4f}\n"
+    "      Causal Impact:        {rec[causal_impact]:.4f}\n"
+    "      ESG Total:            {esg[total_esg]:.4f}\n"
+    "         - Environmental:   {esg[environmental]:.4f}\n"
+    "         - Social:          {esg[social]:.4f}\n"
+    "         - Governance:      {esg[governance]:.4f}\n"
+    "      Integrity Score:      {rec[integrity_score]:.4f}\n"
+    "      Blockchain Verified:  {verified}"
+).format
+
+
+def _print_recommendations(recommendations: list):
+    """Print recommendations table and top recommendation details"""
     if not recommendations:
         print("❌ No recommendations found\n")
-        return []
+        return
     
     # Display recommendations table
-    print(f"{'Rank':<6} {'Title':<40} {'Score':<8} {'Ethics':<8} {'Feasibility':<12} {'Blockchain':<12}")
+    print(_TABLE_HEADER)
     print("─" * 92)
-    
-    for rec in recommendations:
-        print(f"{rec['rank']:<6} {rec['title'][:38]:<40} "
-              f"{rec['adjusted_final_score']:<8.4f} "
-              f"{rec['ethics_score']:<8.4f} "
-              f"{rec['feasibility_score']:<12.4f} "
-              f"{'✓' if rec['blockchain_verified'] else '✗':<12}")
+    print("\n".join(
+        _TABLE_ROW(
+            rank=rec['rank'],
+            title=rec['title'][:38],
+            score=rec['adjusted_final_score'],
+            ethics=rec['ethics_score'],
+            feasibility=rec['feasibility_score'],
+            blockchain='✓' if rec['blockchain_verified'] else '✗'
+        )
+        for rec in recommendations
+    ))
     
     print("\n" + "─" * 80)
     
     # Detailed view of top recommendation
     top_rec = recommendations[0]
-    print(f"\n🏆 TOP RECOMMENDATION: {top_rec['title']}")
-    print(f"   Author: {top_rec['author']}")
-    print(f"   Tags: {', '.join(top_rec['tags'][:5])}")
-    print(f"\n   📊 DETAILED SCORES:")
-    print(f"      Base Score:           {top_rec['final_score']:.4f}")
-    print(f"      Adjusted Score:       {top_rec['adjusted_final_score']:.4f}")
-    print(f"      Ethics Score:         {top_rec['ethics_score']:.4f}")
-    print(f"      Ethics Compliance:    {top_rec['ethics_compliance']:.4f}")
-    print(f"      Feasibility Score:    {top_rec['feasibility_score']:.4f}")
-    print(f"      Causal Impact:        {top_rec['causal_impact']:.4f}")
-    print(f"      ESG Total:            {top_rec['esg_scores']['total_esg']:.4f}")
-    print(f"         - Environmental:   {top_rec['esg_scores']['environmental']:.4f}")
-    print(f"         - Social:          {top_rec['esg_scores']['social']:.4f}")
-    print(f"         - Governance:      {top_rec['esg_scores']['governance']:.4f}")
-    print(f"      Integrity Score:      {top_rec['integrity_score']:.4f}")
-    print(f"      Blockchain Verified:  {'✓' if top_rec['blockchain_verified'] else '✗'}")
+    print(_TOP_DETAILS(
+        rec=top_rec,
+        esg=top_rec['esg_scores'],
+        tags=', '.join(top_rec['tags'][:5]),
+        verified='✓' if top_rec['blockchain_verified'] else '✗'
+    ))
     
     # Explanation
-    if top_rec['explanation']['top_features']:
-        print(f"\n   💡 TOP CONTRIBUTING FEATURES:")
-        for feat in top_rec['explanation']['top_features'][:3]:
-            print(f"      • {feat['feature']}: {feat['contribution']:.4f}")
-    
-    return recommendations
+    top_features = top_rec['explanation']['top_features'][:3]
+    if top_features:
+        print("\n".join([
+            f"\n   💡 TOP CONTRIBUTING FEATURES:",
+            *(f"      • {feat['feature']}: {feat['contribution']:.4f}" for feat in top_features)
+        ]))
 
 
 def display_system_stats(engine):
@@ -246,39 +418,197 @@ def display_system_stats(engine):
     
     report = engine.generate_comprehensive_report()
     
-    print("\n📈 DATABASE STATISTICS:")
-    print(f"   Total Ideas: {report['base_audit']['total_ideas']}")
-    integrity = report['base_audit']['integrity']
-    if isinstance(integrity, dict) and 'valid_count' in integrity:
-        print(f"   Valid Ideas: {integrity['valid_count']}/{integrity['total_count']}")
-        print(f"   Validity Rate: {integrity['validity_rate']:.2%}")
-    else:
-        print(f"   Integrity: OK")
-    print(f"   Bias Detected: {report['base_audit']['bias']['bias_detected']}")
+    with buffered_output():
+        print("\n📈 DATABASE STATISTICS:")
+        print(f"   Total Ideas: {report['base_audit']['total_ideas']}")
+        integrity = report['base_audit']['integrity']
+        if isinstance(integrity, dict) and 'valid_count' in integrity:
+            print(f"   Valid Ideas: {integrity['valid_count']}/{integrity['total_count']}")
+            print(f"   Validity Rate: {integrity['validity_rate']:.2%}")
+        else:
+            print(f"   Integrity: OK")
+        print(f"   Bias Detected: {report['base_audit']['bias']['bias_detected']}")
+        
+        print("\n🔗 BLOCKCHAIN STATUS:")
+        print(f"   Total Blocks: {report['blockchain']['summary']['total_blocks']}")
+        print(f"   Unique Ideas: {report['blockchain']['summary']['unique_ideas']}")
+        print(f"   Chain Valid: {'✓' if report['blockchain']['integrity']['valid'] else '✗'}")
+        
+        print("\n🧠 TEMPORAL MEMORY:")
+        print(f"   Recent Contexts (24h): {report['temporal_memory']['recent_contexts_24h']}")
+        print(f"   Recent Embeddings (7d): {report['temporal_memory']['recent_embeddings_7d']}")
+        
+        print("\n🤝 FEDERATED LEARNING:")
+        print(f"   Update Rounds: {report['federated_learning']['update_rounds']}")
+        
+        if 'meta_learning' in report:
+            print("\n🎯 META-LEARNING:")
+            print(f"   Optimization Runs: {report['meta_learning']['optimization_runs']}")
+            if report['meta_learning']['best_ndcg']:
+                print(f"   Best nDCG: {report['meta_learning']['best_ndcg']:.4f}")
+        
+        print()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Generate ideas from a prompt and get enhanced recommendations"
+    )
+    parser.add_argument("prompt", nargs="*",
+                        help="Idea generation prompt (default: demonstration prompt)")
+    parser.add_argument("--num-ideas", type=int, default=3,
+                        help="Number of ideas to generate")
+    parser.add_argument("--top-k", "-k", type=int, default=5,
+                        help="Number of recommendations to return")
+    parser.add_argument("--db", default="data/ideas.db", help="Database path")
+    parser.add_argument("--model", default="llama3.2:1b", help="Ollama model name")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the semantic prompt cache")
+    parser.add_argument("--json", action="store_true",
+                        help="Emit machine-readable JSON on stdout (progress goes to stderr)")
+    args = parser.parse_args(argv)
     
-    print("\n🔗 BLOCKCHAIN STATUS:")
-    print(f"   Total Blocks: {report['blockchain']['summary']['total_blocks']}")
-    print(f"   Unique Ideas: {report['blockchain']['summary']['unique_ideas']}")
-    print(f"   Chain Valid: {'✓' if report['blockchain']['integrity']['valid'] else '✗'}")
+    # Reject requests the engine would refuse before any ideas are generated
+    # (imported only now, so --help stays fast)
+    from enhanced_engine import EnhancedRecommendationEngine as Engine
+    if not 1 <= args.top_k <= Engine.MAX_TOP_K:
+        parser.error(f"--top-k must be between 1 and {Engine.MAX_TOP_K}")
+    prompt = " ".join(args.prompt).strip()
+    if args.prompt and not prompt:
+        parser.error("prompt cannot be empty")
+    if len(prompt) > Engine.MAX_QUERY_LENGTH:
+        parser.error(f"prompt exceeds {Engine.MAX_QUERY_LENGTH} characters")
+    return args
+
+
+def open_prompt_cache(engine, db_path: str) -> "SemanticIdeaCache":
+    """
+    Open the semantic prompt cache that belongs to a database.
     
-    print("\n🧠 TEMPORAL MEMORY:")
-    print(f"   Recent Contexts (24h): {report['temporal_memory']['recent_contexts_24h']}")
-    print(f"   Recent Embeddings (7d): {report['temporal_memory']['recent_embeddings_7d']}")
+    Args:
+        engine: EnhancedRecommendationEngine instance
+        db_path: Database path (the cache file is stored next to it)
+        
+    Returns:
+        SemanticIdeaCache, or None for in-memory databases
+    """
+    from core.semantic_cache import SemanticIdeaCache
     
-    print("\n🤝 FEDERATED LEARNING:")
-    print(f"   Update Rounds: {report['federated_learning']['update_rounds']}")
+    if db_path == ":memory:":
+        return None
+    # Expire with the engine's recommendation cache so feedback is picked up
+    return SemanticIdeaCache(path=db_path + ".prompt_cache.npz",
+                             ttl_hours=engine.RECOMMENDATION_CACHE_TTL / 3600)
+
+
+def prompt_cache_context(engine, num_ideas: int) -> dict:
+    """
+    Values a cached prompt result depends on besides the prompt itself.
+    The idea count changes whenever ideas are added, invalidating older hits.
     
-    if 'meta_learning' in report:
-        print("\n🎯 META-LEARNING:")
-        print(f"   Optimization Runs: {report['meta_learning']['optimization_runs']}")
-        if report['meta_learning']['best_ndcg']:
-            print(f"   Best nDCG: {report['meta_learning']['best_ndcg']:.4f}")
+    Args:
+        engine: EnhancedRecommendationEngine instance
+        num_ideas: Number of ideas requested
+        
+    Returns:
+        JSON-serializable context dictionary
+    """
+    return {
+        "model": engine.ollama.model,
+        "num_ideas": num_ideas,
+        "idea_count": engine.db.count_ideas()
+    }
+
+
+def run(engine, prompt: str, num_ideas: int = 3, top_k: int = 5,
+        cache: "SemanticIdeaCache" = None) -> dict:
+    """
+    Run the full generate → add → recommend pipeline
     
-    print()
+    Args:
+        engine: EnhancedRecommendationEngine instance
+        prompt: User's idea generation prompt
+        num_ideas: Number of ideas to generate
+        top_k: Number of recommendations
+        cache: Optional semantic prompt cache (skips the pipeline on a hit)
+        
+    Returns:
+        Dictionary with generated ideas, added ideas and recommendations
+    """
+    if cache is not None:
+        prompt_embedding = engine.ollama.generate_embedding(prompt)
+        hit = cache.lookup(prompt_embedding, prompt_cache_context(engine, num_ideas))
+        if hit and len(hit["recommendations"]) >= top_k:
+            print_section("SEMANTIC CACHE HIT")
+            print(f"Reusing results for \"{hit['prompt']}\" (similarity {hit['similarity']:.3f})\n")
+            recommendations = hit["recommendations"][:top_k]
+            display_recommendations(recommendations)
+            return {
+                "prompt": prompt,
+                "generated": hit["ideas"],
+                "added": [],
+                "recommendations": recommendations,
+                "cached": True
+            }
+    
+    # Each streamed idea enters the add pipeline in a worker thread while the
+    # LLM is still generating the next one
+    with ThreadPoolExecutor(max_workers=1) as pipeline:
+        in_flight = []
+        generated_ideas = generate_ideas_from_prompt(
+            engine, prompt, num_ideas=num_ideas,
+            on_idea=lambda idea: in_flight.append(
+                (idea, pipeline.submit(engine.add_idea_enhanced, **idea)))
+        )
+        results = None
+        if in_flight and [idea for idea, _ in in_flight] == generated_ideas:
+            results = [future.result() for _, future in in_flight]
+    
+    if not generated_ideas:
+        return {"prompt": prompt, "generated": [], "added": [], "recommendations": []}
+    
+    print(f"✅ Generated {len(generated_ideas)} unique ideas\n")
+    
+    added_ideas = add_ideas_to_system(engine, generated_ideas, results=results)
+    
+    if not added_ideas:
+        print("⚠️  No new ideas added (all were duplicates or blocked)")
+        # Continue anyway to show existing recommendations
+    
+    recommendations = get_recommendations(engine, prompt, top_k=top_k)
+    
+    if cache is not None and recommendations:
+        cache.insert(prompt, prompt_embedding, generated_ideas, recommendations,
+                     prompt_cache_context(engine, num_ideas))
+    
+    return {
+        "prompt": prompt,
+        "generated": generated_ideas,
+        "added": added_ideas,
+        "recommendations": recommendations
+    }
 
 
-def main():
+def main(argv=None):
     """Main execution flow"""
+    args = parse_args(argv)
+    
+    # Heavy imports only after argument parsing (keeps --help fast)
+    from enhanced_engine import EnhancedRecommendationEngine
+    
+    if args.json:
+        # Keep stdout clean for JSON; route progress output to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            engine = EnhancedRecommendationEngine(db_path=args.db, ollama_model=args.model)
+            prompt = " ".join(args.prompt) or "sustainable technology for climate change"
+            cache = None if args.no_cache else open_prompt_cache(engine, args.db)
+            result = run(engine, prompt, num_ideas=args.num_ideas, top_k=args.top_k,
+                         cache=cache)
+        json.dump(result, sys.stdout, indent=2, default=str)
+        print()
+        return 0 if result["generated"] else 1
+    
     print_banner()
     
     # Initialize enhanced engine
@@ -287,8 +617,8 @@ def main():
     
     try:
         engine = EnhancedRecommendationEngine(
-            db_path="data/ideas.db",
-            ollama_model="llama3.2:1b"  # Using available model
+            db_path=args.db,
+            ollama_model=args.model
         )
         print("   ✅ Engine initialized successfully\n")
     except Exception as e:
@@ -296,8 +626,8 @@ def main():
         return 1
     
     # Get user prompt (or use default for demonstration)
-    if len(sys.argv) > 1:
-        user_prompt = " ".join(sys.argv[1:])
+    if args.prompt:
+        user_prompt = " ".join(args.prompt)
     else:
         print("💡 No prompt provided. Using default demonstration prompt.")
         print("   Usage: python main.py \"your idea generation prompt\"\n")
@@ -306,25 +636,18 @@ def main():
     print(f"🎯 Your Prompt: \"{user_prompt}\"")
     
     try:
-        # Step 1: Generate ideas from prompt
-        generated_ideas = generate_ideas_from_prompt(engine, user_prompt, num_ideas=3)
+        # Steps 1-3: Generate ideas, add them with full pipeline, get recommendations
+        cache = None if args.no_cache else open_prompt_cache(engine, args.db)
+        result = run(engine, user_prompt, num_ideas=args.num_ideas, top_k=args.top_k,
+                     cache=cache)
+        generated_ideas = result["generated"]
+        added_ideas = result["added"]
+        recommendations = result["recommendations"]
         
         if not generated_ideas:
             print("❌ No ideas generated. Exiting.")
             return 1
         
-        print(f"✅ Generated {len(generated_ideas)} unique ideas\n")
-        
-        # Step 2: Add ideas to system with full pipeline
-        added_ideas = add_ideas_to_system(engine, generated_ideas)
-        
-        if not added_ideas:
-            print("⚠️  No new ideas added (all were duplicates or blocked)")
-            # Continue anyway to show existing recommendations
-        
-        # Step 3: Get recommendations
-        recommendations = get_recommendations(engine, user_prompt, top_k=5)
-        
         # Step 4: Display system statistics
         display_system_stats(engine)
         
@@ -333,7 +656,7 @@ def main():
         print(f"\n   ✅ Ideas Generated: {len(generated_ideas)}")
         print(f"   ✅ Ideas Added: {len(added_ideas)}")
         print(f"   ✅ Recommendations: {len(recommendations)}")
-        print(f"   ✅ Database Updated: ideas.db")
+        print(f"   ✅ Database Updated: {args.db}")
         print(f"   ✅ Blockchain Verified: All ideas have tamper-proof hashes")
         print(f"   ✅ No Duplicates: Duplicate detection active")
         print(f"\n   📄 See 'docs/document.md' for detailed documentation")
@@ -9,17 +9,52 @@ import os
 # Add parent directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Set UTF-8 encoding
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
-
 from enhanced_engine import EnhancedRecommendationEngine
+from cli_utils import buffered_output
 from datetime import datetime
 import json
 
 
+# Per-recommendation score block, formatted once per recommendation
+_SCORES_TEMPLATE = (
+    "SCORES:\n"
+    "  - Base Score:           {rec[final_score]:.4f}\n"
+    "  - Adjusted Score:       {rec[adjusted_final_score]:.4f}\n"
+    "  - Ethics Score:         {rec[ethics_score]:.4f}\n"
+    "  - Ethics Compliance:    {rec[ethics_compliance]:.4f}\n"
+    "  - Feasibility Score:    {rec[feasibility_score]:.4f}\n"
+    "  - Causal Impact:        {rec[causal_impact]:.4f}\n"
+    "  - ESG Total:            {esg[total_esg]:.4f}\n"
+    "  - Environmental:        {esg[environmental]:.4f}\n"
+    "  - Social:               {esg[social]:.4f}\n"
+    "  - Governance:           {esg[governance]:.4f}\n"
+    "  - Blockchain Verified:  {verified}\n"
+).format
+
+
+def _format_recommendation(rec: dict) -> str:
+    """Full text block for one recommendation"""
+    lines = [
+        f"RANK #{rec['rank']}: {rec['title']}",
+        f"Author: {rec['author']}",
+        f"Tags: {', '.join(rec['tags'][:5])}\n",
+        _SCORES_TEMPLATE(
+            rec=rec,
+            esg=rec['esg_scores'],
+            verified='YES' if rec['blockchain_verified'] else 'NO'
+        )
+    ]
+    
+    top_features = rec['explanation']['top_features'][:3]
+    if top_features:
+        lines.append("TOP FEATURES:")
+        lines.extend(f"  - {feat['feature']}: {feat['contribution']:.4f}" for feat in top_features)
+        lines.append("")
+    
+    lines.append("-" * 90 + "\n")
+    return "\n".join(lines)
+
+
 def main():
     print("\n" + "=" * 90)
     print("  GIG - GREATEST IDEA GENERATION")
@@ -70,26 +105,26 @@ def main():
     
     added_ideas = []
     skipped_duplicates = 0
-    for idx, idea in enumerate(ideas_to_add, 1):
-        print(f"         [{idx}/{len(ideas_to_add)}] {idea['title'][:60]}...")
-        
-        result = engine.add_idea_enhanced(**idea)
-        
-        if result["success"]:
-            added_ideas.append(result)
-            print(f"             SUCCESS")
-            print(f"             - ID: {result['idea_id']}")
-            print(f"             - Ethics Score: {result['ethics_assessment']['ethical_score']:.3f}")
-            print(f"             - Feasibility: {result['feasibility_analysis']['feasibility_score']:.3f}")
-            print(f"             - ROI Level: {result['feasibility_analysis']['roi_level']}")
-            print(f"             - Risk Level: {result['feasibility_analysis']['risk_level']}")
-            print(f"             - Blockchain Hash: {result['blockchain_hash'][:32]}...")
-            print()
-        elif result.get("duplicate"):
-            skipped_duplicates += 1
-            print(f"             SKIPPED: Already exists in database\n")
-        else:
-            print(f"             FAILED: {result.get('error')}\n")
+    results = engine.add_ideas_enhanced(ideas_to_add)
+    for idx, (idea, result) in enumerate(zip(ideas_to_add, results), 1):
+        with buffered_output():
+            print(f"         [{idx}/{len(ideas_to_add)}] {idea['title'][:60]}...")
+            
+            if result["success"]:
+                added_ideas.append(result)
+                print(f"             SUCCESS")
+                print(f"             - ID: {result['idea_id']}")
+                print(f"             - Ethics Score: {result['ethics_assessment']['ethical_score']:.3f}")
+                print(f"             - Feasibility: {result['feasibility_analysis']['feasibility_score']:.3f}")
+                print(f"             - ROI Level: {result['feasibility_analysis']['roi_level']}")
+                print(f"             - Risk Level: {result['feasibility_analysis']['risk_level']}")
+                print(f"             - Blockchain Hash: {result['blockchain_hash'][:32]}...")
+                print()
+            elif result.get("duplicate"):
+                skipped_duplicates += 1
+                print(f"             SKIPPED: Already exists in database\n")
+            else:
+                print(f"             FAILED: {result.get('error')}\n")
     
     # Get recommendations
     print(f"\n[STEP 5] Retrieving Recommendations...")
@@ -104,55 +139,33 @@ def main():
             use_feasibility=True
         )
         
-        print("=" * 90)
-        print("  RECOMMENDATION RESULTS")
-        print("=" * 90 + "\n")
-        
-        for rec in recommendations:
-            print(f"RANK #{rec['rank']}: {rec['title']}")
-            print(f"Author: {rec['author']}")
-            print(f"Tags: {', '.join(rec['tags'][:5])}\n")
-            
-            print(f"SCORES:")
-            print(f"  - Base Score:           {rec['final_score']:.4f}")
-            print(f"  - Adjusted Score:       {rec['adjusted_final_score']:.4f}")
-            print(f"  - Ethics Score:         {rec['ethics_score']:.4f}")
-            print(f"  - Ethics Compliance:    {rec['ethics_compliance']:.4f}")
-            print(f"  - Feasibility Score:    {rec['feasibility_score']:.4f}")
-            print(f"  - Causal Impact:        {rec['causal_impact']:.4f}")
-            print(f"  - ESG Total:            {rec['esg_scores']['total_esg']:.4f}")
-            print(f"  - Environmental:        {rec['esg_scores']['environmental']:.4f}")
-            print(f"  - Social:               {rec['esg_scores']['social']:.4f}")
-            print(f"  - Governance:           {rec['esg_scores']['governance']:.4f}")
-            print(f"  - Blockchain Verified:  {'YES' if rec['blockchain_verified'] else 'NO'}\n")
-            
-            if rec['explanation']['top_features']:
-                print("TOP FEATURES:")
-                for feat in rec['explanation']['top_features'][:3]:
-                    print(f"  - {feat['feature']}: {feat['contribution']:.4f}")
-                print()
+        with buffered_output():
+            print("=" * 90)
+            print("  RECOMMENDATION RESULTS")
+            print("=" * 90 + "\n")
             
-            print("-" * 90 + "\n")
+            print("\n".join(_format_recommendation(rec) for rec in recommendations))
         
         # System statistics
         print("\n[STEP 6] System Statistics & Integrity Check...")
         report = engine.generate_comprehensive_report()
         
-        print(f"\nDATABASE:")
-        print(f"  - Total Ideas: {report['base_audit']['total_ideas']}")
-        print(f"  - Valid Ideas: {report['base_audit']['integrity']['valid']}/{report['base_audit']['integrity']['total']}")
-        print(f"  - Validity Rate: {report['base_audit']['integrity']['validity_rate']:.2%}")
-        print(f"  - Bias Detected: {report['base_audit']['bias']['bias_detected']}")
-        
-        print(f"\nBLOCKCHAIN:")
-        print(f"  - Total Blocks: {report['blockchain']['summary']['total_blocks']}")
-        print(f"  - Unique Ideas: {report['blockchain']['summary']['unique_ideas']}")
-        print(f"  - Chain Valid: {report['blockchain']['integrity']['valid']}")
-        
-        print(f"\nTEMPORAL MEMORY:")
-        print(f"  - Recent Contexts (24h): {report['temporal_memory']['recent_contexts_24h']}")
-        print(f"  - Recent Embeddings (7d): {report['temporal_memory']['recent_embeddings_7d']}")
-        
+        with buffered_output():
+            print(f"\nDATABASE:")
+            print(f"  - Total Ideas: {report['base_audit']['total_ideas']}")
+            print(f"  - Valid Ideas: {report['base_audit']['integrity']['valid']}/{report['base_audit']['integrity']['total']}")
+            print(f"  - Validity Rate: {report['base_audit']['integrity']['validity_rate']:.2%}")
+            print(f"  - Bias Detected: {report['base_audit']['bias']['bias_detected']}")
+            
+            print(f"\nBLOCKCHAIN:")
+            print(f"  - Total Blocks: {report['blockchain']['summary']['total_blocks']}")
+            print(f"  - Unique Ideas: {report['blockchain']['summary']['unique_ideas']}")
+            print(f"  - Chain Valid: {report['blockchain']['integrity']['valid']}")
+            
+            print(f"\nTEMPORAL MEMORY:")
+            print(f"  - Recent Contexts (24h): {report['temporal_memory']['recent_contexts_24h']}")
+            print(f"  - Recent Embeddings (7d): {report['temporal_memory']['recent_embeddings_7d']}")
+            
         print("\n" + "=" * 90)
         print("  EVALUATION COMPLETE - ALL SYSTEMS FUNCTIONAL")
         print("=" * 90)
@@ -178,5 +191,9 @@ def main():
 
 
 if __name__ == "__main__":
+    # Set UTF-8 encoding (console only; importing this module leaves streams alone)
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
     exit_code = main()
     sys.exit(exit_code)
@@ -6,23 +6,283 @@ Automatically adapts to your query (example: Delhi AQI hardware solutions)
 
 import sys
 import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import numpy as np
-from enhanced_engine import EnhancedRecommendationEngine
+# Plotting libraries are imported on first use (see _configure_mpl), so
+# importing this module or running --help doesn't pay matplotlib's start-up
+plt = None
+mpatches = None
+np = None
+Image = None
 
-# Set style
-plt.style.use('default')
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.grid'] = True
-plt.rcParams['grid.alpha'] = 0.3
+# Output settings: 150 DPI is crisp on screen, and zlib level 1 encodes PNGs
+# several times faster than the default level 6 for ~10-15% larger files
+SAVE_DPI = 150
+PNG_COMPRESS_LEVEL = 1
+HEATMAP_ANNOTATION_LIMIT = 200  # Max heatmap cells that get value labels
 
+# Shared bold fonts by point size, resolved once instead of per label
+# (filled in by _configure_mpl)
+BOLD_FONTS = {}
 
-def create_comprehensive_dashboard():
-    """Create a comprehensive multi-panel visualization dashboard"""
+
+def _hex_to_rgba(hex_color):
+    """Convert '#rrggbb' to an opaque RGBA tuple of floats"""
+    return tuple(int(hex_color[i:i + 2], 16) / 255 for i in (1, 3, 5)) + (1.0,)
+
+
+# Palette resolved to RGBA tuples once, so artists skip hex parsing per call
+PALETTE = {name: _hex_to_rgba(hex_color) for name, hex_color in {
+    'blue': '#3498db',
+    'green': '#2ecc71',
+    'orange': '#f39c12',
+    'red': '#e74c3c',
+    'dark_green': '#27ae60',
+    'purple': '#9b59b6',
+}.items()}
+
+
+def _configure_mpl():
+    """Import the plotting stack and apply the shared style (once per process)"""
+    global plt, mpatches, np, Image
+    if plt is not None:
+        return
+    
+    import matplotlib
+    matplotlib.use('Agg')  # File output only: skip GUI backend probing
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    from matplotlib.font_manager import FontProperties
+    import numpy as np
+    from PIL import Image
+    
+    # Set style
+    plt.style.use('default')
+    plt.rcParams['font.family'] = 'sans-serif'
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['axes.grid'] = True
+    plt.rcParams['grid.alpha'] = 0.3
+    
+    BOLD_FONTS.update({size: FontProperties(weight='bold', size=size)
+                       for size in (9, 10, 11, 12, 14, 16)})
+
+
+def blend(color, alpha, background=(1.0, 1.0, 1.0)):
+    """
+    Pre-blend a color over an opaque background.
+    
+    Bars that never overlap other artists look the same drawn opaque in the
+    blended color, and Agg fills opaque patches without per-pixel blending.
+    
+    Args:
+        color: RGBA tuple
+        alpha: Opacity to bake in
+        background: RGB background the color is drawn over
+        
+    Returns:
+        Opaque RGB tuple
+    """
+    return tuple(c * alpha + bg * (1 - alpha) for c, bg in zip(color[:3], background))
+
+
+SCORE_COLORS = tuple(blend(PALETTE[name], 0.8) for name in ('blue', 'green', 'orange'))
+BAR_COLORS = {name: blend(color, 0.7) for name, color in PALETTE.items()}
+TIMELINE_COLORS = {'Short-term': BAR_COLORS['green'],
+                   'Medium-term': BAR_COLORS['orange'],
+                   'Long-term': BAR_COLORS['red']}
+
+
+# Technology category -> (keywords matched in the lowercased title,
+# keywords matched in the joined tags)
+TECH_KEYWORDS = {
+    'IoT/Sensors': (('iot', 'sensor'), ('iot',)),
+    'AI/ML': (('ai', 'smart'), ('ai',)),
+    'Hardware': (('hardware',), ('hardware',)),
+    'Monitoring': (('monitor', 'emission'), ()),
+    'Purification': (('purif', 'clean'), ()),
+}
+
+
+# One reusable figure per size: regenerating the dashboard in the same
+# process clears and redraws these instead of building new figures
+_FIGURE_CACHE = {}
+
+# Open multi-page PDF while render_pdf runs; save_figure appends pages to it
+_PDF_REPORT = None
+
+# Background PNG encoder used by in-process rendering; save_figure hands it
+# rendered pixels so encoding overlaps with drawing the next plot
+_PNG_WRITER = None
+
+
+def get_figure(figsize):
+    """
+    Get a cleared figure of the given size and make it current.
+    
+    Args:
+        figsize: Figure size (width, height) in inches
+        
+    Returns:
+        Matplotlib Figure
+    """
+    _configure_mpl()
+    fig = _FIGURE_CACHE.get(figsize)
+    if fig is None:
+        # Render at output resolution so saving needs no DPI switch
+        fig = plt.figure(figsize=figsize, dpi=SAVE_DPI)
+        _FIGURE_CACHE[figsize] = fig
+    else:
+        fig.clear()
+        plt.figure(fig.number)
+    return fig
+
+
+def save_figure(output_dir, filename, tight=False):
+    """
+    Save the current figure as PNG (or as a page of the open PDF report)
+    and clear it for reuse.
+    
+    Args:
+        output_dir: Output directory
+        filename: PNG file name
+        tight: Crop to a tight bbox (extra layout pass; only needed when a
+            legend is anchored outside the axes)
+        
+    Returns:
+        File name that was written (a Future of it while a background PNG
+        writer is active)
+    """
+    fig = plt.gcf()
+    if _PDF_REPORT is not None:
+        _PDF_REPORT.savefig(fig, bbox_inches='tight' if tight else None)
+        fig.clear()
+        return filename
+    
+    path = os.path.join(output_dir, filename)
+    pil_kwargs = {'compress_level': PNG_COMPRESS_LEVEL}
+    if _PNG_WRITER is not None and not tight:
+        fig.canvas.draw()
+        pixels = np.asarray(fig.canvas.buffer_rgba()).copy()
+        fig.clear()
+        return _PNG_WRITER.submit(write_png, pixels, path)
+    if tight:
+        fig.savefig(path, dpi=SAVE_DPI, bbox_inches='tight', pil_kwargs=pil_kwargs)
+    else:
+        # Direct Agg render + PNG encode, bypassing savefig's setup
+        fig.canvas.print_png(path, pil_kwargs=pil_kwargs)
+    fig.clear()  # Keep the cached figure, drop its artists
+    return filename
+
+
+def write_png(pixels, path):
+    """
+    Encode an RGBA pixel buffer as PNG (Pillow releases the GIL while
+    compressing, so this runs alongside rendering in a worker thread).
+    
+    Args:
+        pixels: (height, width, 4) uint8 array
+        path: Output PNG path
+        
+    Returns:
+        File name that was written
+    """
+    Image.fromarray(pixels, 'RGBA').save(
+        path, format='png', compress_level=PNG_COMPRESS_LEVEL,
+        dpi=(SAVE_DPI, SAVE_DPI))
+    return os.path.basename(path)
+
+
+def shorten_titles(titles, limit):
+    """
+    Truncate titles longer than limit, marking the cut with '...'.
+    
+    Args:
+        titles: Full titles
+        limit: Maximum characters kept before the ellipsis
+        
+    Returns:
+        List of display titles
+    """
+    return [title if len(title) <= limit else title[:limit] + '...' for title in titles]
+
+
+def dashboard_plots():
+    """Plot functions that make up the dashboard, in output order"""
+    return [
+        plot_comprehensive_scores,
+        plot_feasibility_analysis,
+        plot_impact_matrix,
+        plot_recommendation_flow,
+        plot_technology_comparison,
+    ]
+
+
+def render_pdf(recommendations, path):
+    """
+    Render every dashboard plot as one page of a single PDF.
+    
+    Fonts, style and the output file are set up once for the whole
+    dashboard instead of once per PNG.
+    
+    Args:
+        recommendations: Recommendations to visualize
+        path: Output PDF path
+    """
+    # The PDF backend is only needed for --pdf runs (and never in PNG workers)
+    from matplotlib.backends.backend_pdf import PdfPages
+    
+    global _PDF_REPORT
+    with PdfPages(path) as pdf:
+        _PDF_REPORT = pdf
+        try:
+            for plot in dashboard_plots():
+                print(f"✅ Added page: {os.path.splitext(plot(recommendations, None))[0]}")
+        finally:
+            _PDF_REPORT = None
+
+
+def render_all(recommendations, output_dir, max_workers=None):
+    """
+    Render every dashboard plot, one worker process per plot.
+    
+    Args:
+        recommendations: Recommendations to visualize
+        output_dir: Output directory
+        max_workers: Process cap (defaults to CPU count; 1 renders in-process)
+    """
+    plots = dashboard_plots()
+    workers = min(len(plots), max_workers or os.cpu_count() or 1)
+    
+    if workers <= 1:
+        # Draw in this thread, encode finished PNGs in a background thread
+        global _PNG_WRITER
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            _PNG_WRITER = writer
+            try:
+                pending = [plot(recommendations, output_dir) for plot in plots]
+            finally:
+                _PNG_WRITER = None
+            for result in pending:
+                name = result.result() if isinstance(result, Future) else result
+                print(f"✅ Generated: {name}")
+        return
+    
+    # Plots are independent and CPU-bound (Agg render + PNG encode); workers
+    # stay silent and only this process reports progress
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(plot, recommendations, output_dir) for plot in plots]
+        for future in futures:
+            print(f"✅ Generated: {future.result()}")
+
+
+def create_comprehensive_dashboard(pdf=False):
+    """
+    Create a comprehensive multi-panel visualization dashboard.
+    
+    Args:
+        pdf: Write one multi-page dashboard.pdf instead of separate PNGs
+    """
     
     print("\n" + "=" * 80)
     print("  GENERATING ENHANCED VISUALIZATIONS")
@@ -30,6 +290,8 @@ def create_comprehensive_dashboard():
     
     # Initialize engine and get real data
     print("Loading data from database...")
+    # Imported here so plot worker processes don't load the engine stack
+    from enhanced_engine import EnhancedRecommendationEngine
     engine = EnhancedRecommendationEngine("data/ideas.db")
     
     # Get recommendations for Delhi AQI query
@@ -52,16 +314,19 @@ def create_comprehensive_dashboard():
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate all visualizations
-    plot_comprehensive_scores(recommendations, output_dir)
-    plot_feasibility_analysis(recommendations, output_dir)
-    plot_impact_matrix(recommendations, output_dir)
-    plot_recommendation_flow(recommendations, output_dir)
-    plot_technology_comparison(recommendations, output_dir)
+    if pdf:
+        render_pdf(recommendations, os.path.join(output_dir, 'dashboard.pdf'))
+    else:
+        render_all(recommendations, output_dir)
     
     print("\n" + "=" * 80)
     print("  ✅ ALL VISUALIZATIONS GENERATED SUCCESSFULLY")
     print("=" * 80)
     print(f"\n📁 Output directory: {output_dir}\n")
+    if pdf:
+        print("Generated file:")
+        print("  dashboard.pdf (one page per chart)\n")
+        return
     print("Generated files:")
     print("  1. comprehensive_scores.png")
     print("  2. feasibility_analysis.png")
@@ -73,92 +338,101 @@ def create_comprehensive_dashboard():
 def plot_comprehensive_scores(recommendations, output_dir):
     """Create comprehensive score comparison with multiple metrics"""
     
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    fig = get_figure((16, 12))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
     fig.suptitle('GIG Recommendations - Comprehensive Score Analysis', 
-                 fontsize=16, fontweight='bold', y=0.995)
-    
-    titles = [rec['title'][:40] + '...' if len(rec['title']) > 40 else rec['title'] 
-              for rec in recommendations[:5]]
+                 fontproperties=BOLD_FONTS[16], y=0.995)
+    
+    top = recommendations[:5]
+    raw_titles = [rec['title'] for rec in top]
+    titles = shorten_titles(raw_titles, 40)
+    
+    # Extract every numeric field in one pass; panels index columns
+    metrics = np.array([
+        (rec['final_score'],
+         rec['adjusted_final_score'],
+         rec['feasibility_score'],
+         rec['esg_scores']['environmental'],
+         rec['esg_scores']['social'],
+         rec['esg_scores']['governance'],
+         rec.get('ethics_score', 0))
+        for rec in top
+    ], dtype=np.float32).reshape(-1, 7)
+    final, adjusted, feasibility, _, _, _, ethics_scores = metrics.T
     
     # Panel 1: Overall Score Comparison
     scores = {
-        'Final Score': [rec['final_score'] for rec in recommendations[:5]],
-        'Adjusted Score': [rec['adjusted_final_score'] for rec in recommendations[:5]],
-        'Feasibility': [rec['feasibility_score'] for rec in recommendations[:5]]
+        'Final Score': final,
+        'Adjusted Score': adjusted,
+        'Feasibility': feasibility
     }
     
     x = np.arange(len(titles))
     width = 0.25
     
-    colors = ['#3498db', '#2ecc71', '#f39c12']
     for i, (label, values) in enumerate(scores.items()):
-        ax1.bar(x + i * width, values, width, label=label, color=colors[i], alpha=0.8)
+        ax1.bar(x + i * width, values, width, label=label, color=SCORE_COLORS[i])
     
-    ax1.set_ylabel('Score', fontweight='bold', fontsize=11)
-    ax1.set_title('Score Comparison', fontweight='bold', fontsize=12)
+    ax1.set_ylabel('Score', fontproperties=BOLD_FONTS[11])
+    ax1.set_title('Score Comparison', fontproperties=BOLD_FONTS[12])
     ax1.set_xticks(x + width)
     ax1.set_xticklabels(titles, rotation=20, ha='right', fontsize=9)
     ax1.legend(loc='upper right', framealpha=0.9)
     ax1.grid(axis='y', alpha=0.3)
-    ax1.set_ylim(0, max([max(v) for v in scores.values()]) * 1.2)
-    
-    # Panel 2: ESG Impact Scores
-    esg_env = [rec['esg_scores']['environmental'] for rec in recommendations[:5]]
-    esg_soc = [rec['esg_scores']['social'] for rec in recommendations[:5]]
-    esg_gov = [rec['esg_scores']['governance'] for rec in recommendations[:5]]
-    
-    ax2.barh(titles, esg_env, label='Environmental', color='#27ae60', alpha=0.7)
-    ax2.barh(titles, esg_soc, left=esg_env, label='Social', color='#3498db', alpha=0.7)
-    ax2.barh(titles, esg_gov, 
-             left=[e+s for e,s in zip(esg_env, esg_soc)], 
-             label='Governance', color='#9b59b6', alpha=0.7)
-    
-    ax2.set_xlabel('ESG Score', fontweight='bold', fontsize=11)
-    ax2.set_title('ESG Impact Analysis', fontweight='bold', fontsize=12)
+    ax1.set_ylim(0, float(metrics[:, :3].max()) * 1.2)
+    
+    # Panel 2: ESG Impact Scores (stack offsets from one cumulative sum)
+    esg = metrics[:, 3:6]
+    esg_left = np.cumsum(esg, axis=1) - esg
+    for k, (label, color) in enumerate((('Environmental', 'dark_green'),
+                                        ('Social', 'blue'),
+                                        ('Governance', 'purple'))):
+        ax2.barh(titles, esg[:, k], left=esg_left[:, k], label=label,
+                 color=BAR_COLORS[color])
+    
+    ax2.set_xlabel('ESG Score', fontproperties=BOLD_FONTS[11])
+    ax2.set_title('ESG Impact Analysis', fontproperties=BOLD_FONTS[12])
     ax2.legend(loc='lower right', framealpha=0.9)
     ax2.grid(axis='x', alpha=0.3)
     
     # Panel 3: Feature Scores
     feature_names = ['Final Score', 'Feasibility', 'Ethics', 'ESG']
-    feature_matrix = []
-    
-    for rec in recommendations[:5]:
-        feature_matrix.append([
-            rec['final_score'],
-            rec['feasibility_score'],
-            rec['ethics_score'],
-            rec['esg_scores']['environmental'] + rec['esg_scores']['social'] + rec['esg_scores']['governance']
-        ])
-    
-    if feature_matrix:
-        im = ax3.imshow(feature_matrix, cmap='YlOrRd', aspect='auto', vmin=0)
+    feature_matrix = np.column_stack(
+        (final, feasibility, ethics_scores, esg.sum(axis=1)))
+    
+    if feature_matrix.size:
+        # imshow draws the whole matrix as one raster image, so large matrices
+        # stay cheap; 'nearest' skips antialiased resampling of big grids
+        im = ax3.imshow(feature_matrix, cmap='YlOrRd', aspect='auto', vmin=0,
+                        interpolation='nearest')
+        im.set_rasterized(True)  # Keeps vector exports small if DPI/format change
         ax3.set_xticks(np.arange(len(feature_names)))
         ax3.set_yticks(np.arange(len(titles)))
         ax3.set_xticklabels(feature_names, rotation=45, ha='right')
-        ax3.set_yticklabels([t[:30] + '...' if len(t) > 30 else t for t in titles], fontsize=9)
-        ax3.set_title('Feature Importance Heatmap', fontweight='bold', fontsize=12)
+        ax3.set_yticklabels(shorten_titles(raw_titles, 30), fontsize=9)
+        ax3.set_title('Feature Importance Heatmap', fontproperties=BOLD_FONTS[12])
         
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax3)
+        cbar = fig.colorbar(im, ax=ax3)
         cbar.set_label('Contribution', rotation=270, labelpad=15)
         
-        # Add values on heatmap
-        for i in range(len(titles)):
-            for j in range(len(feature_names)):
-                text = ax3.text(j, i, f'{feature_matrix[i][j]:.3f}',
-                               ha="center", va="center", color="black", fontsize=8)
+        # Add values on heatmap (skipped when cells would be too small to read)
+        if feature_matrix.size <= HEATMAP_ANNOTATION_LIMIT:
+            rows, cols = np.indices(feature_matrix.shape)
+            for i, j, label in zip(rows.ravel(), cols.ravel(), np.char.mod('%.3f', feature_matrix.ravel())):
+                ax3.text(j, i, label, ha="center", va="center", color="black", fontsize=8)
     
     # Panel 4: Ethics & Compliance
-    ethics_scores = [rec.get('ethics_score', 0) for rec in recommendations[:5]]
-    blockchain_verified = [rec.get('blockchain_verified', False) for rec in recommendations[:5]]
+    blockchain_verified = [rec.get('blockchain_verified', False) for rec in top]
     
-    colors_ethics = ['#2ecc71' if e > 0.7 else '#f39c12' if e > 0.5 else '#e74c3c' 
-                     for e in ethics_scores]
+    ethics_palette = (BAR_COLORS['red'], BAR_COLORS['orange'], BAR_COLORS['green'])
+    ethics_bands = np.searchsorted([0.5, 0.7], ethics_scores)
+    colors_ethics = [ethics_palette[band] for band in ethics_bands]
     
-    bars = ax4.bar(range(len(titles)), ethics_scores, color=colors_ethics, alpha=0.7)
-    ax4.set_ylabel('Ethics Score', fontweight='bold', fontsize=11)
-    ax4.set_title('Ethics & Blockchain Verification', fontweight='bold', fontsize=12)
-    ax4.set_xticks(range(len(titles)))
+    bars = ax4.bar(x, ethics_scores, color=colors_ethics)
+    ax4.set_ylabel('Ethics Score', fontproperties=BOLD_FONTS[11])
+    ax4.set_title('Ethics & Blockchain Verification', fontproperties=BOLD_FONTS[12])
+    ax4.set_xticks(x)
     ax4.set_xticklabels([f"{i+1}" for i in range(len(titles))])
     ax4.set_ylim(0, 1)
     ax4.grid(axis='y', alpha=0.3)
@@ -167,30 +441,30 @@ def plot_comprehensive_scores(recommendations, output_dir):
     for i, (verified, bar) in enumerate(zip(blockchain_verified, bars)):
         if verified:
             ax4.text(i, bar.get_height() + 0.02, '✓ BC', 
-                    ha='center', fontsize=9, color='#2ecc71', fontweight='bold')
+                    ha='center', color=PALETTE['green'], fontproperties=BOLD_FONTS[9])
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'comprehensive_scores.png'), 
-                dpi=300, bbox_inches='tight')
-    print("✅ Generated: comprehensive_scores.png")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(output_dir, 'comprehensive_scores.png')
 
 
 def plot_feasibility_analysis(recommendations, output_dir):
     """Plot economic feasibility analysis"""
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig = get_figure((14, 6))
+    # The radar panel is created polar up front (no throwaway cartesian axes)
+    ax1 = fig.add_subplot(1, 2, 1)
+    ax2 = fig.add_subplot(1, 2, 2, projection='polar')
     fig.suptitle('GIG Recommendations - Economic Feasibility Analysis', 
-                 fontsize=14, fontweight='bold')
+                 fontproperties=BOLD_FONTS[14])
     
     titles = [f"Idea #{i+1}" for i in range(min(5, len(recommendations)))]
-    feasibility = [rec['feasibility_score'] for rec in recommendations[:5]]
-    roi = [feasibility[i] * 0.9 + 0.1 for i in range(len(recommendations[:5]))]  # Estimate ROI
-    risk = [1 - feasibility[i] * 0.7 for i in range(len(recommendations[:5]))]
+    feasibility = np.fromiter((rec['feasibility_score'] for rec in recommendations[:5]),
+                              dtype=np.float32)
+    roi = feasibility * 0.9 + 0.1  # Estimate ROI
+    risk = 1 - feasibility * 0.7
     
     # Bubble chart: Feasibility vs ROI vs Risk
-    sizes = [(1-r) * 1000 for r in risk]  # Bigger bubble = lower risk
-    colors_bubble = plt.cm.RdYlGn([f for f in feasibility])
+    sizes = (1 - risk) * 1000  # Bigger bubble = lower risk
     
     scatter = ax1.scatter(feasibility, roi, s=sizes, c=feasibility, 
                          cmap='RdYlGn', alpha=0.6, edgecolors='black', linewidth=2)
@@ -199,40 +473,40 @@ def plot_feasibility_analysis(recommendations, output_dir):
         ax1.annotate(title, (feasibility[i], roi[i]), 
                     xytext=(5, 5), textcoords='offset points', fontsize=9)
     
-    ax1.set_xlabel('Feasibility Score', fontweight='bold', fontsize=11)
-    ax1.set_ylabel('ROI Potential', fontweight='bold', fontsize=11)
+    ax1.set_xlabel('Feasibility Score', fontproperties=BOLD_FONTS[11])
+    ax1.set_ylabel('ROI Potential', fontproperties=BOLD_FONTS[11])
     ax1.set_title('Feasibility vs ROI (bubble size = low risk)', fontweight='bold')
     ax1.grid(True, alpha=0.3)
     ax1.set_xlim(0, 1)
     ax1.set_ylim(0, 1)
     
     # Add colorbar
-    cbar = plt.colorbar(scatter, ax=ax1)
+    cbar = fig.colorbar(scatter, ax=ax1)
     cbar.set_label('Feasibility', rotation=270, labelpad=15)
     
     # Risk assessment radar
     labels = ['Market Risk', 'Technical Risk', 'Financial Risk', 'Regulatory Risk', 'Competition']
-    angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
-    angles += angles[:1]
-    
-    ax2 = plt.subplot(122, projection='polar')
-    
-    for i, rec in enumerate(recommendations[:3]):
-        # Simulate risk scores
-        risk_scores = [
-            risk[i],  # Market
-            1 - feasibility[i],  # Technical
-            risk[i] * 0.9,  # Financial
-            risk[i] * 0.8,  # Regulatory
-            risk[i] * 1.1  # Competition
-        ]
-        risk_scores += risk_scores[:1]
-        
-        ax2.plot(angles, risk_scores, 'o-', linewidth=2, 
+    angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False)
+    closed_angles = np.append(angles, angles[0])
+    
+    # Simulated risk profiles for the top 3 ideas, one row each, with the
+    # first column repeated to close the polygon
+    top_risk = risk[:3]
+    risk_profiles = np.column_stack((
+        top_risk,  # Market
+        1 - feasibility[:3],  # Technical
+        top_risk * 0.9,  # Financial
+        top_risk * 0.8,  # Regulatory
+        top_risk * 1.1,  # Competition
+        top_risk  # Closes the loop back to Market
+    ))
+    
+    for i, risk_scores in enumerate(risk_profiles):
+        ax2.plot(closed_angles, risk_scores, 'o-', linewidth=2, 
                 label=f'Idea #{i+1}', alpha=0.7)
-        ax2.fill(angles, risk_scores, alpha=0.15)
+        ax2.fill(closed_angles, risk_scores, alpha=0.15)
     
-    ax2.set_xticks(angles[:-1])
+    ax2.set_xticks(angles)
     ax2.set_xticklabels(labels, fontsize=9)
     ax2.set_ylim(0, 1)
     ax2.set_title('Risk Assessment Radar\n(Top 3 Ideas)', 
@@ -240,29 +514,29 @@ def plot_feasibility_analysis(recommendations, output_dir):
     ax2.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
     ax2.grid(True)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'feasibility_analysis.png'), 
-                dpi=300, bbox_inches='tight')
-    print("✅ Generated: feasibility_analysis.png")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(output_dir, 'feasibility_analysis.png', tight=True)
 
 
 def plot_impact_matrix(recommendations, output_dir):
     """Plot impact vs effort matrix"""
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = get_figure((12, 8))
+    ax = fig.subplots()
     fig.suptitle('GIG Recommendations - Impact vs Implementation Effort Matrix', 
-                 fontsize=14, fontweight='bold')
+                 fontproperties=BOLD_FONTS[14])
     
     # Calculate impact and effort
-    impact = [rec['adjusted_final_score'] for rec in recommendations[:8]]
-    effort = [1 - rec['feasibility_score'] for rec in recommendations[:8]]
-    titles = [rec['title'][:30] + '...' if len(rec['title']) > 30 else rec['title'] 
-              for rec in recommendations[:8]]
+    impact, feasibility = np.array([
+        (rec['adjusted_final_score'], rec['feasibility_score'])
+        for rec in recommendations[:8]
+    ], dtype=np.float32).reshape(-1, 2).T
+    effort = 1 - feasibility
+    titles = shorten_titles((rec['title'] for rec in recommendations[:8]), 30)
     
     # Color by priority (high impact, low effort = green)
-    priority = [imp / (eff + 0.1) for imp, eff in zip(impact, effort)]
-    colors = plt.cm.RdYlGn([p / max(priority) for p in priority])
+    priority = impact / (effort + 0.1)
+    colors = plt.cm.RdYlGn(priority / priority.max())
     
     # Scatter plot
     scatter = ax.scatter(effort, impact, s=500, c=colors, alpha=0.6, 
@@ -271,7 +545,7 @@ def plot_impact_matrix(recommendations, output_dir):
     # Add labels
     for i, title in enumerate(titles):
         ax.annotate(f"{i+1}", (effort[i], impact[i]), 
-                   ha='center', va='center', fontweight='bold', fontsize=11)
+                   ha='center', va='center', fontproperties=BOLD_FONTS[11])
     
     # Add quadrant lines
     ax.axhline(y=np.median(impact), color='gray', linestyle='--', alpha=0.5)
@@ -292,11 +566,11 @@ def plot_impact_matrix(recommendations, output_dir):
            bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
     
     ax.set_xlabel('Implementation Effort (Complexity, Cost, Time)', 
-                 fontweight='bold', fontsize=11)
+                 fontproperties=BOLD_FONTS[11])
     ax.set_ylabel('Potential Impact (Score, ESG, Feasibility)', 
-                 fontweight='bold', fontsize=11)
+                 fontproperties=BOLD_FONTS[11])
     ax.set_xlim(-0.1, 1.1)
-    ax.set_ylim(0, max(impact) * 1.1)
+    ax.set_ylim(0, float(impact.max()) * 1.1)
     ax.grid(True, alpha=0.3)
     
     # Add legend
@@ -305,19 +579,17 @@ def plot_impact_matrix(recommendations, output_dir):
     ax.legend(handles=legend_elements, loc='center left', 
              bbox_to_anchor=(1, 0.5), fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'impact_matrix.png'), 
-                dpi=300, bbox_inches='tight')
-    print("✅ Generated: impact_matrix.png")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(output_dir, 'impact_matrix.png', tight=True)
 
 
 def plot_recommendation_flow(recommendations, output_dir):
     """Plot recommendation decision flow"""
     
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = get_figure((14, 8))
+    ax = fig.subplots()
     fig.suptitle('GIG Recommendations - Decision Flow', 
-                 fontsize=14, fontweight='bold')
+                 fontproperties=BOLD_FONTS[14])
     
     # Create funnel visualization
     stages = ['Ideas Generated', 'Ethics Approved', 'Feasibility Passed', 
@@ -341,7 +613,7 @@ def plot_recommendation_flow(recommendations, output_dir):
         
         # Add text
         ax.text(0.5, i, f'{stage}\n{count} ideas', 
-               ha='center', va='center', fontweight='bold', fontsize=11)
+               ha='center', va='center', fontproperties=BOLD_FONTS[11])
         
         # Add arrows between stages
         if i < len(stages) - 1:
@@ -369,44 +641,30 @@ def plot_recommendation_flow(recommendations, output_dir):
            fontsize=10, verticalalignment='bottom', horizontalalignment='right',
            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'recommendation_flow.png'), 
-                dpi=300, bbox_inches='tight')
-    print("✅ Generated: recommendation_flow.png")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(output_dir, 'recommendation_flow.png')
 
 
 def plot_technology_comparison(recommendations, output_dir):
     """Plot technology type comparison"""
     
-    fig = plt.figure(figsize=(14, 10))
+    fig = get_figure((14, 10))
     gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
     fig.suptitle('GIG Recommendations - Technology Analysis', 
-                 fontsize=16, fontweight='bold')
-    
-    # Extract technology categories from titles/tags
-    tech_categories = {
-        'IoT/Sensors': 0,
-        'AI/ML': 0,
-        'Hardware': 0,
-        'Monitoring': 0,
-        'Purification': 0
-    }
+                 fontproperties=BOLD_FONTS[16])
+    
+    # Extract technology categories from titles/tags (title and tag text
+    # are built once per idea, then scanned per keyword)
+    tech_categories = dict.fromkeys(TECH_KEYWORDS, 0)
     
     for rec in recommendations:
         title = rec['title'].lower()
-        tags = rec.get('tags', [])
+        tag_text = ' '.join(rec.get('tags', []))
         
-        if 'iot' in title or 'sensor' in title or 'iot' in ' '.join(tags):
-            tech_categories['IoT/Sensors'] += 1
-        if 'ai' in title or 'smart' in title or 'ai' in ' '.join(tags):
-            tech_categories['AI/ML'] += 1
-        if 'hardware' in title or 'hardware' in ' '.join(tags):
-            tech_categories['Hardware'] += 1
-        if 'monitor' in title or 'emission' in title:
-            tech_categories['Monitoring'] += 1
-        if 'purif' in title or 'clean' in title:
-            tech_categories['Purification'] += 1
+        for category, (title_keywords, tag_keywords) in TECH_KEYWORDS.items():
+            if (any(k in title for k in title_keywords)
+                    or any(k in tag_text for k in tag_keywords)):
+                tech_categories[category] += 1
     
     # Panel 1: Technology distribution pie chart
     ax1 = fig.add_subplot(gs[0, 0])
@@ -421,7 +679,7 @@ def plot_technology_comparison(recommendations, output_dir):
             autotext.set_color('white')
             autotext.set_fontweight('bold')
     
-    ax1.set_title('Technology Distribution', fontweight='bold', fontsize=12)
+    ax1.set_title('Technology Distribution', fontproperties=BOLD_FONTS[12])
     
     # Panel 2: Score by technology type
     ax2 = fig.add_subplot(gs[0, 1])
@@ -443,17 +701,16 @@ def plot_technology_comparison(recommendations, output_dir):
     
     if tech_scores:
         tech_names = list(tech_scores.keys())
-        avg_scores = [np.mean(scores) for scores in tech_scores.values()]
+        avg_scores = np.fromiter((np.mean(scores) for scores in tech_scores.values()),
+                                 dtype=np.float32, count=len(tech_scores))
         
         bars = ax2.barh(tech_names, avg_scores, color=plt.cm.Spectral(np.linspace(0.2, 0.8, len(tech_names))))
         ax2.set_xlabel('Average Score', fontweight='bold')
-        ax2.set_title('Performance by Technology Type', fontweight='bold', fontsize=12)
+        ax2.set_title('Performance by Technology Type', fontproperties=BOLD_FONTS[12])
         ax2.grid(axis='x', alpha=0.3)
         
         # Add value labels
-        for i, (bar, score) in enumerate(zip(bars, avg_scores)):
-            ax2.text(score + 0.01, i, f'{score:.3f}', 
-                    va='center', fontweight='bold', fontsize=9)
+        ax2.bar_label(bars, fmt='%.3f', padding=3, fontproperties=BOLD_FONTS[9])
     
     # Panel 3: Implementation timeline
     ax3 = fig.add_subplot(gs[1, :])
@@ -465,36 +722,38 @@ def plot_technology_comparison(recommendations, output_dir):
     ]
     
     y_pos = 0
-    colors_timeline = {'Short-term': '#2ecc71', 'Medium-term': '#f39c12', 'Long-term': '#e74c3c'}
-    
     for idea, term, months, score in ideas_timeline:
         ax3.barh(y_pos, months, left=0, height=0.6, 
-                color=colors_timeline[term], alpha=0.7, edgecolor='black')
+                color=TIMELINE_COLORS[term], edgecolor='black')
         ax3.text(months/2, y_pos, f'{idea}\n{months} months', 
-                ha='center', va='center', fontweight='bold', fontsize=10)
+                ha='center', va='center', fontproperties=BOLD_FONTS[10])
         ax3.text(months + 0.3, y_pos, f'Score: {score:.2f}', 
                 va='center', fontsize=9)
         y_pos += 1
     
     ax3.set_yticks([])
-    ax3.set_xlabel('Implementation Timeline (months)', fontweight='bold', fontsize=11)
-    ax3.set_title('Implementation Timeline by Solution Type', fontweight='bold', fontsize=12)
+    ax3.set_xlabel('Implementation Timeline (months)', fontproperties=BOLD_FONTS[11])
+    ax3.set_title('Implementation Timeline by Solution Type', fontproperties=BOLD_FONTS[12])
     ax3.set_xlim(0, 8)
     ax3.grid(axis='x', alpha=0.3)
     
     # Add legend
     legend_elements = [mpatches.Patch(facecolor=color, label=term) 
-                      for term, color in colors_timeline.items()]
+                      for term, color in TIMELINE_COLORS.items()]
     ax3.legend(handles=legend_elements, loc='upper right', framealpha=0.9)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'technology_comparison.png'), 
-                dpi=300, bbox_inches='tight')
-    print("✅ Generated: technology_comparison.png")
-    plt.close()
+    fig.tight_layout()
+    return save_figure(output_dir, 'technology_comparison.png')
 
 
 if __name__ == "__main__":
-    create_comprehensive_dashboard()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Generate recommendation visualizations")
+    parser.add_argument("--pdf", action="store_true",
+                       help="Write a single multi-page PDF instead of PNG files")
+    
+    args = parser.parse_args()
+    create_comprehensive_dashboard(pdf=args.pdf)
     print("\n🎨 Enhanced visualizations complete!")
     print("   Perfect for presentations and reports! 📊\n")